@@ -3,10 +3,11 @@ HandyOsint API - Secure REST API for advanced OSINT intelligence and reconnaissa
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, status
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
 
 from core.auth import UserPayload, verify_access_token
@@ -14,18 +15,47 @@ from core.integration import IntegrationCoordinator, ScanPriority
 from core.job_repository import JobRepository
 from core.models import PlatformResult, ScanBatchResult
 from core.production_scanner import ProductionScanner
-
-# pylint: disable=protected-access
+from core.serialization import HAS_ORJSON
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI) -> AsyncIterator[None]:
+    """Create the scanner, coordinator, and job repository for the app's lifetime."""
+    logger.info("Initializing ProductionScanner...")
+    async with ProductionScanner(max_concurrent=10) as scanner:
+        app_.state.scanner = scanner
+        logger.info("ProductionScanner initialized.")
+
+        logger.info("Initializing IntegrationCoordinator...")
+        app_.state.coordinator = IntegrationCoordinator()
+        logger.info("IntegrationCoordinator initialized.")
+
+        logger.info("Initializing JobRepository...")
+        jobs = JobRepository()
+        await jobs.connect()
+        app_.state.jobs = jobs
+        logger.info("JobRepository initialized.")
+
+        try:
+            yield
+        finally:
+            logger.info("Closing JobRepository...")
+            await jobs.disconnect()
+            logger.info("JobRepository closed.")
+            logger.info("Closing ProductionScanner session...")
+    logger.info("ProductionScanner session closed.")
+
 app = FastAPI(
     title="HandyOsint API",
     description="Secure REST API for advanced OSINT intelligence and reconnaissance.",
     version="1.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
     openapi_tags=[
         {"name": "health", "description": "Service health & readiness"},
         {"name": "scans", "description": "Submit and manage OSINT scan jobs"},
@@ -35,17 +65,6 @@ app = FastAPI(
 )
 
 
-@dataclass
-class AppState:
-    """Container for application-scoped state objects."""
-
-    scanner: Optional[ProductionScanner] = None
-    coordinator: Optional[IntegrationCoordinator] = None
-    jobs: Optional[JobRepository] = None
-
-
-state = AppState()
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
@@ -64,38 +83,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserPayload:
         ) from exc
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Initialize scanner, coordinator, and job repository on application startup."""
-    logger.info("Initializing ProductionScanner...")
-    scanner = ProductionScanner(max_concurrent=10)
-    await scanner._ensure_session()  # pylint: disable=E1101
-    state.scanner = scanner
-    logger.info("ProductionScanner initialized.")
+def get_scanner(request: Request) -> ProductionScanner:
+    """Inject the application-scoped scanner."""
+    return request.app.state.scanner
 
-    logger.info("Initializing IntegrationCoordinator...")
-    state.coordinator = IntegrationCoordinator()
-    logger.info("IntegrationCoordinator initialized.")
 
-    logger.info("Initializing JobRepository...")
-    jobs = JobRepository()
-    await jobs.connect()
-    state.jobs = jobs
-    logger.info("JobRepository initialized.")
+def get_coordinator(request: Request) -> IntegrationCoordinator:
+    """Inject the application-scoped integration coordinator."""
+    return request.app.state.coordinator
 
 
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Close scanner session and job repository on application shutdown."""
-    if state.scanner:
-        logger.info("Closing ProductionScanner session...")
-        await state.scanner.close()
-        logger.info("ProductionScanner session closed.")
-
-    if state.jobs:
-        logger.info("Closing JobRepository...")
-        await state.jobs.disconnect()
-        logger.info("JobRepository closed.")
+def get_jobs(request: Request) -> JobRepository:
+    """Inject the application-scoped job repository."""
+    return request.app.state.jobs
 
 
 @app.get("/health", tags=["health"])
@@ -128,18 +128,14 @@ async def scan_username_api(
     username: str,
     background_tasks: BackgroundTasks,
     current_user: UserPayload = Depends(get_current_user),
+    coordinator: IntegrationCoordinator = Depends(get_coordinator),
+    jobs: JobRepository = Depends(get_jobs),
 ) -> Dict[str, str]:
     """
     Submit a scan job for a given username across all available platforms.
     """
     del current_user
 
-    if not state.coordinator or not state.jobs:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Service not fully initialized. Please try again in a moment.",
-        )
-
     if not username or not username.strip():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,11 +143,11 @@ async def scan_username_api(
         )
 
     try:
-        job = state.coordinator.create_batch_job(
+        job = coordinator.create_batch_job(
             usernames=[username],
             priority=ScanPriority.NORMAL,
         )
-        await state.jobs.save_job(
+        await jobs.save_job(
             job_id=job.job_id,
             username=username,
             status="queued",
@@ -181,18 +177,13 @@ async def scan_username_api(
 )
 async def get_platforms_info(
     current_user: UserPayload = Depends(get_current_user),
+    scanner: ProductionScanner = Depends(get_scanner),
 ) -> Dict[str, Any]:
     """Retrieve information about all configured OSINT platforms."""
     del current_user
 
-    if not state.scanner:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Scanner not initialized. Please try again in a moment.",
-        )
-
     try:
-        return state.scanner.get_platform_info()
+        return scanner.get_platform_info()
     except Exception as exc:  # pylint: disable=broad-except
         logger.error(
             "Error retrieving platform info: %s",
@@ -213,21 +204,17 @@ async def get_platforms_info(
 async def get_job_status_api(
     job_id: str,
     current_user: UserPayload = Depends(get_current_user),
+    coordinator: IntegrationCoordinator = Depends(get_coordinator),
+    jobs: JobRepository = Depends(get_jobs),
 ) -> Dict[str, Any]:
     """
     Retrieve the status of a specific scan job.
     """
     del current_user
 
-    if not state.coordinator or not state.jobs:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Service not fully initialized.",
-        )
-
-    job_status = state.coordinator.get_job_status(job_id)
+    job_status = coordinator.get_job_status(job_id)
     if job_status is None:
-        stored = await state.jobs.get_job(job_id)
+        stored = await jobs.get_job(job_id)
         if not stored:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -235,7 +222,7 @@ async def get_job_status_api(
             )
         return stored
 
-    await state.jobs.update_job_status(
+    await jobs.update_job_status(
         job_id=job_id,
         status=str(job_status.get("status", "unknown")),
     )
@@ -250,26 +237,21 @@ async def get_job_status_api(
 async def get_job_results_api(
     job_id: str,
     current_user: UserPayload = Depends(get_current_user),
+    jobs: JobRepository = Depends(get_jobs),
 ) -> ScanBatchResult:
     """
     Retrieve all platform results for a completed job in structured JSON form.
     """
     del current_user
 
-    if not state.jobs:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Job repository not initialized.",
-        )
-
-    job = await state.jobs.get_job(job_id)
+    job = await jobs.get_job(job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job '{job_id}' not found.",
         )
 
-    results_raw = await state.jobs.get_results_for_job(job_id)
+    results_raw = await jobs.get_results_for_job(job_id)
     results = [PlatformResult(**record) for record in results_raw]
 
     return ScanBatchResult(
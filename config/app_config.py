@@ -1,20 +1,40 @@
+import json
+import threading
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+# Prefer the libyaml C bindings; fall back to the pure-Python loader/dumper.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 class AppConfig:
     _instance = None
+    _instance_lock = threading.Lock()
     _config: Dict[str, Any] = {}
     _base_dir: Path = Path('.') # Default to current directory
     _config_file_name: str = "config.yaml"
+    _flat: Dict[str, Any] = {}
+    _mtime: float = 0.0
+    # Keys whose values are paths relative to the project root (base_dir)
+    _PATH_KEYS = ('database.path', 'logging.file')
 
     def __new__(cls, base_dir: Path = Path('.')):
         if cls._instance is None:
-            cls._instance = super(AppConfig, cls).__new__(cls)
-            # Set base_dir and config_path immediately on the new instance
-            cls._instance._base_dir = base_dir
-            cls._instance._config_path = base_dir / "config" / cls._config_file_name
-            cls._instance._load_config()
+            # Double-checked: concurrent first calls must not parse the YAML twice
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(AppConfig, cls).__new__(cls)
+                    # Set base_dir and config_path immediately on the new instance
+                    instance._base_dir = base_dir
+                    instance._config_path = base_dir / "config" / cls._config_file_name
+                    instance._flat = {}
+                    instance._load_config()
+                    # Publish only once fully loaded
+                    cls._instance = instance
+                    return instance
         # If instance already exists, ensure its base_dir matches or raise an error/warning
         # For this application, base_dir should be consistent once set.
         elif cls._instance._base_dir != base_dir:
@@ -23,31 +43,81 @@ class AppConfig:
         return cls._instance
 
     def _load_config(self):
+        self._read_config()
+        self._mtime = self._config_mtime()
+        self._build_flat()
+
+    def reload(self, force: bool = False):
+        """Re-read the config file, skipping the parse if it is unchanged on disk."""
+        if not force and self._config_mtime() == self._mtime:
+            return
+        self._load_config()
+
+    def _config_mtime(self) -> float:
+        try:
+            return self._config_path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _read_config(self):
         if not self._config_path.exists():
             print(f"Warning: Configuration file not found at {self._config_path}. Using default settings.")
             self._config = self._get_default_config()
             self._save_config() # Save default config if not found
             return
 
+        # Warm start: reuse the JSON sidecar while it is newer than the YAML source
+        raw = self._load_cached_config()
         try:
-            with open(self._config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f) or {{}}
-            # Merge with defaults to ensure all keys are present
+            if raw is None:
+                with open(self._config_path, 'r', encoding='utf-8') as f:
+                    raw = yaml.load(f, Loader=_Loader) or {}
+                self._write_cached_config(raw)
+            # Merge with defaults to ensure all keys are present. The sidecar
+            # holds the file as written, so new code defaults apply on warm starts
             default_config = self._get_default_config()
-            self._config = {{**default_config, **self._config}}
+            self._config = {**default_config, **raw}
         except yaml.YAMLError as e:
-            print(f"Error loading configuration from {self._config_path}: {{e}}. Using default settings.")
+            print(f"Error loading configuration from {self._config_path}: {e}. Using default settings.")
             self._config = self._get_default_config()
         except Exception as e:
-            print(f"An unexpected error occurred while loading config: {{e}}. Using default settings.")
+            print(f"An unexpected error occurred while loading config: {e}. Using default settings.")
             self._config = self._get_default_config()
 
+    def _cache_path(self) -> Path:
+        return self._config_path.with_suffix('.yaml.json')
+
+    def _load_cached_config(self) -> Optional[Dict[str, Any]]:
+        """Return the cached YAML contents if the sidecar is at least as new as the file."""
+        cache_path = self._cache_path()
+        try:
+            if cache_path.stat().st_mtime < self._config_path.stat().st_mtime:
+                return None
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_cached_config(self, raw: Any):
+        try:
+            dumped = json.dumps(raw)
+        except (TypeError, ValueError):
+            return
+        if json.loads(dumped) != raw:
+            return  # YAML-only types (dates, non-string keys) would not survive JSON
+        try:
+            self._cache_path().write_text(dumped, encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: Could not write config cache {self._cache_path()}: {e}.")
+
     def _save_config(self):
         try:
             with open(self._config_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(self._config, f, indent=2)
+                yaml.dump(self._config, f, Dumper=_Dumper, indent=2)
+            # The in-memory config is already current; don't re-parse our own write
+            self._mtime = self._config_mtime()
         except Exception as e:
-            print(f"Error saving default configuration to {self._config_path}: {{e}}.")
+            print(f"Error saving default configuration to {self._config_path}: {e}.")
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Define sensible default configuration settings."""
@@ -72,22 +142,27 @@ class AppConfig:
             }
         }
 
+    def _build_flat(self):
+        """Index every nested value under its dotted key for single-lookup get()."""
+        flat: Dict[str, Any] = {}
+        stack = [('', self._config)]
+        while stack:
+            prefix, section = stack.pop()
+            for name, value in section.items():
+                key = f"{prefix}{name}"
+                flat[key] = value
+                if isinstance(value, dict):
+                    stack.append((f"{key}.", value))
+
+        for key in self._PATH_KEYS:
+            value = flat.get(key)
+            if isinstance(value, str):
+                # Paths in config.yaml are relative to the project root (base_dir)
+                flat[key] = self._base_dir / Path(value)
+        self._flat = flat
+
     def get(self, key: str, default: Any = None) -> Any:
-        parts = key.split('.')
-        current = self._config
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
-        
-        # Resolve paths relative to base_dir if they are config paths
-        if key in ['database.path', 'logging.file'] and isinstance(current, str):
-            # Ensure the path is relative to the config file's location, which is then relative to base_dir
-            # The path in config.yaml is relative to the project root (where config.yaml is)
-            return self._base_dir / Path(current)
-        
-        return current
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any):
         parts = key.split('.')
@@ -96,8 +171,9 @@ class AppConfig:
             if i == len(parts) - 1:
                 current[part] = value
             elif part not in current or not isinstance(current[part], dict):
-                current[part] = {{}}
+                current[part] = {}
             current = current[part]
+        self._build_flat()
         self._save_config() # Save changes immediately
 
 
@@ -123,7 +199,7 @@ if __name__ == "__main__":
     
     # Reload config from dummy file
     config = AppConfig()
-    config._load_config()
+    config.reload(force=True)
 
     print(f"Max concurrent requests: {config.get('scanner.max_concurrent_requests')}")
     print(f"Proxies: {config.get('scanner.proxies')}")
@@ -147,5 +223,5 @@ if __name__ == "__main__":
     
     # Verify it was saved
     reloaded_config = AppConfig()
-    reloaded_config._load_config()
+    reloaded_config.reload(force=True)
     print(f"Reloaded config timeout: {reloaded_config.get('scanner.request_timeout')}")
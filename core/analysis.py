@@ -3,9 +3,12 @@
 Advanced analysis engine for HandyOsint.
 """
 
+import bisect
 import logging
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 from config.platforms import PLATFORM_CATEGORIES, PLATFORM_INFO
 from core.cache import CacheManager
@@ -14,97 +17,172 @@ from core.models import CorrelationData, PlatformResult, RiskLevel, ScanAnalysis
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _PlatformView:
+    """The PLATFORM_INFO fields the analysis engine reads, resolved once."""
+
+    audience: Optional[str]
+    risk_score: float
+    category: Optional[str]
+    activity: Optional[str]
+    exposure_count: int
+
+
+# PLATFORM_INFO mixes value types, so mypy would infer each record as object
+_PLATFORM_VIEWS: Dict[str, _PlatformView] = {
+    platform_id: _PlatformView(
+        audience=record.get("audience"),
+        risk_score=record.get("risk_score", 0.5),
+        category=record.get("category"),
+        activity=record.get("activity_type"),
+        exposure_count=len(record.get("data_exposure", [])),
+    )
+    for platform_id, record in cast(Dict[str, Dict[str, Any]], PLATFORM_INFO).items()
+}
+# Stand-in for platform ids missing from PLATFORM_INFO
+_UNKNOWN_PLATFORM = _PlatformView(None, 0.5, None, None, 0)
+
+_MAX_EXPOSURE = sum(view.exposure_count for view in _PLATFORM_VIEWS.values())
+_N_CATEGORIES = len(PLATFORM_CATEGORIES)
+
+# Lower bounds of MEDIUM, HIGH and CRITICAL; bisect_right indexes _RISK_LEVELS
+_RISK_THRESHOLDS = (0.40, 0.60, 0.75)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+_MONETIZATION_PLATFORMS = frozenset(("patreon", "youtube", "twitch", "medium"))
+
+# Primary platform -> platforms whose accounts are often linked to it
+_PLATFORM_PAIRS: Dict[str, Tuple[str, ...]] = {
+    "github": ("gitlab", "codepen", "stackoverflow"),
+    "twitter": ("linkedin", "instagram", "reddit"),
+    "youtube": ("twitch", "tiktok", "instagram"),
+    "linkedin": ("twitter", "github"),
+}
+
+
+# pylint: disable=R0902
+@dataclass
+class _ScanStats:
+    """Everything the analysis helpers need, gathered in one pass over the results."""
+
+    platforms: Dict[str, PlatformResult]
+    found: List[PlatformResult] = field(default_factory=list)
+    found_ids: Set[str] = field(default_factory=set)
+    public_count: int = 0
+    configurable_count: int = 0
+    non_public_count: int = 0
+    risk_sum: float = 0.0
+    response_time_sum: float = 0.0
+    exposure_items: int = 0
+    category_counts: Counter = field(default_factory=Counter)
+    activity_counts: Dict[str, int] = field(default_factory=dict)
+    monetization_count: int = 0
+    blocked: bool = False
+
+
+def _collect_stats(platforms: Dict[str, PlatformResult]) -> _ScanStats:
+    """Walk the scan results once, updating every counter the engine uses."""
+    stats = _ScanStats(platforms=platforms)
+    views = _PLATFORM_VIEWS
+    categories = stats.category_counts
+    activities = stats.activity_counts
+
+    for result in platforms.values():
+        if result.status == "blocked":
+            stats.blocked = True
+        if not result.found:
+            continue
+
+        platform_id = result.platform_id
+        stats.found.append(result)
+        stats.found_ids.add(platform_id)
+        stats.response_time_sum += result.response_time
+        view = views.get(platform_id, _UNKNOWN_PLATFORM)
+
+        audience = view.audience
+        if audience == "public":
+            stats.public_count += 1
+        else:
+            stats.non_public_count += 1
+            if audience == "configurable":
+                stats.configurable_count += 1
+
+        stats.risk_sum += view.risk_score
+        stats.exposure_items += view.exposure_count
+
+        category = view.category
+        if category:
+            categories[category] += 1
+        activity = view.activity
+        if activity:
+            activities[activity] = activities.get(activity, 0) + 1
+        if platform_id in _MONETIZATION_PLATFORMS:
+            stats.monetization_count += 1
+
+    return stats
+
+
 class AdvancedAnalysisEngine:
     """Machine learning and pattern analysis."""
 
     def __init__(self) -> None:
         """Initialize analysis engine."""
         self.cache = CacheManager()
+        # (analysis, stats) for the most recent analysis, so scoring and
+        # correlation of the same scan share one pass over its results
+        self._last_stats: Optional[Tuple[weakref.ref, _ScanStats]] = None
         logger.info("Advanced Analysis Engine initialized")
 
+    def _stats(self, analysis: ScanAnalysis) -> _ScanStats:
+        """Return the single-pass statistics for an analysis, reusing the last ones."""
+        if self._last_stats is not None:
+            ref, stats = self._last_stats
+            if ref() is analysis and stats.platforms is analysis.platforms:
+                return stats
+        stats = _collect_stats(analysis.platforms)
+        self._last_stats = (weakref.ref(analysis), stats)
+        return stats
+
     def calculate_risk_score(self, analysis: ScanAnalysis) -> Tuple[float, RiskLevel]:
         """Calculate comprehensive risk score."""
         if not analysis.platforms:
             return 0.0, RiskLevel.LOW
 
+        stats = self._stats(analysis)
         risk_factors = []
 
         # Factor 1: Number of public profiles
-        public_count = sum(
-            1
-            for p in analysis.platforms.values()
-            if PLATFORM_INFO.get(p.platform_id, {}).get("audience") == "public"
-            and p.found
-        )
-        public_risk = min(public_count * 0.15, 0.6)
+        public_risk = min(stats.public_count * 0.15, 0.6)
         risk_factors.append(public_risk)
 
         # Factor 2: Platform risk scores
-        platform_risks = []
-        for result in analysis.platforms.values():
-            if result.found:
-                platform_info = PLATFORM_INFO.get(result.platform_id, {})
-                platform_risks.append(platform_info.get("risk_score", 0.5))
-
-        if platform_risks:
-            avg_platform_risk = sum(platform_risks) / len(platform_risks)
+        if stats.found:
+            avg_platform_risk = stats.risk_sum / len(stats.found)
             risk_factors.append(avg_platform_risk * 0.4)
 
         # Factor 3: Coverage across categories
-        category_coverage = self._calculate_category_coverage(analysis.platforms)
+        category_coverage = self._calculate_category_coverage(stats)
         risk_factors.append(category_coverage * 0.25)
 
         # Factor 4: Data exposure breadth
-        exposure_risk = self._calculate_exposure_risk(analysis.platforms)
+        exposure_risk = self._calculate_exposure_risk(stats)
         risk_factors.append(exposure_risk * 0.2)
 
         overall_score = sum(risk_factors) / len(risk_factors) if risk_factors else 0.0
         overall_score = min(overall_score, 1.0)
 
         # Determine risk level
-        if overall_score >= 0.75:
-            risk_level = RiskLevel.CRITICAL
-        elif overall_score >= 0.60:
-            risk_level = RiskLevel.HIGH
-        elif overall_score >= 0.40:
-            risk_level = RiskLevel.MEDIUM
-        else:
-            risk_level = RiskLevel.LOW
+        risk_level = _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, overall_score)]
 
         return round(overall_score, 3), risk_level
 
-    def _calculate_category_coverage(
-        self, platforms: Dict[str, PlatformResult]
-    ) -> float:
+    def _calculate_category_coverage(self, stats: _ScanStats) -> float:
         """Calculate coverage across platform categories."""
-        found_categories = set()
-        for result in platforms.values():
-            if result.found:
-                platform_info = PLATFORM_INFO.get(result.platform_id, {})
-                category = platform_info.get("category")
-                if category:
-                    found_categories.add(category)
+        return len(stats.category_counts) / _N_CATEGORIES
 
-        return len(found_categories) / len(PLATFORM_CATEGORIES)
-
-    def _calculate_exposure_risk(self, platforms: Dict[str, PlatformResult]) -> float:
+    def _calculate_exposure_risk(self, stats: _ScanStats) -> float:
         """Calculate data exposure risk."""
-        total_exposure_items = 0
-        for result in platforms.values():
-            if result.found:
-                platform_info = PLATFORM_INFO.get(result.platform_id, {})
-                exposure = platform_info.get("data_exposure", [])
-                total_exposure_items += len(exposure)
-
-        max_possible_exposure = sum(
-            len(p.get("data_exposure", [])) for p in PLATFORM_INFO.values()
-        )
-
-        return (
-            total_exposure_items / max_possible_exposure
-            if max_possible_exposure
-            else 0.0
-        )
+        return stats.exposure_items / _MAX_EXPOSURE if _MAX_EXPOSURE else 0.0
 
     def analyze_correlations(self, analysis: ScanAnalysis) -> CorrelationData:
         """Perform correlation analysis."""
@@ -113,23 +191,20 @@ class AdvancedAnalysisEngine:
         if cached:
             return cached
 
+        stats = self._stats(analysis)
         correlation = CorrelationData(username=analysis.username)
 
         # Pattern detection
-        correlation.common_patterns = self._detect_patterns(analysis.platforms)
+        correlation.common_patterns = self._detect_patterns(stats)
 
         # Likelihood connections
-        correlation.likely_connections = self._find_likely_connections(
-            analysis.platforms
-        )
+        correlation.likely_connections = self._find_likely_connections(stats)
 
         # Behavioral fingerprint
-        correlation.behavioral_fingerprint = self._create_fingerprint(
-            analysis.platforms
-        )
+        correlation.behavioral_fingerprint = self._create_fingerprint(stats)
 
         # Anomaly detection
-        correlation.anomalies = self._detect_anomalies(analysis.platforms)
+        correlation.anomalies = self._detect_anomalies(stats)
 
         # Confidence score
         correlation.confidence_score = self._calculate_confidence(correlation)
@@ -137,87 +212,50 @@ class AdvancedAnalysisEngine:
         self.cache.set(cache_key, correlation)
         return correlation
 
-    def _detect_patterns(self, platforms: Dict[str, PlatformResult]) -> List[str]:
+    def _detect_patterns(self, stats: _ScanStats) -> List[str]:
         """Detect common patterns in usernames/profiles."""
         patterns = []
-        found_platforms = {p for p in platforms.values() if p.found}
 
-        if len(found_platforms) >= 3:
+        if len(stats.found) >= 3:
             patterns.append("Multi-platform presence detected")
 
-        category_counts = defaultdict(int)
-        for result in found_platforms:
-            platform_info = PLATFORM_INFO.get(result.platform_id, {})
-            category = platform_info.get("category")
-            if category:
-                category_counts[category] += 1
-
-        for category, count in category_counts.items():
+        for category, count in stats.category_counts.items():
             if count >= 2:
                 cat_name = PLATFORM_CATEGORIES.get(category, {}).get("name", category)
                 patterns.append(f"Strong presence in {cat_name} ({count} platforms)")
 
         return patterns
 
-    def _find_likely_connections(
-        self, platforms: Dict[str, PlatformResult]
-    ) -> Dict[str, List[str]]:
+    def _find_likely_connections(self, stats: _ScanStats) -> Dict[str, List[str]]:
         """Find likely connections between platforms."""
-        connections = defaultdict(list)
-        found_ids = {p.platform_id for p in platforms.values() if p.found}
-
-        platform_pairs = [
-            ("github", ["gitlab", "codepen", "stackoverflow"]),
-            ("twitter", ["linkedin", "instagram", "reddit"]),
-            ("youtube", ["twitch", "tiktok", "instagram"]),
-            ("linkedin", ["twitter", "github"]),
-        ]
-
-        for primary, secondaries in platform_pairs:
-            if primary in found_ids:
-                connections[primary] = [s for s in secondaries if s in found_ids]
-
-        return dict(connections)
+        found_ids = stats.found_ids
+        return {
+            primary: [s for s in secondaries if s in found_ids]
+            for primary, secondaries in _PLATFORM_PAIRS.items()
+            if primary in found_ids
+        }
 
-    def _create_fingerprint(
-        self, platforms: Dict[str, PlatformResult]
-    ) -> Dict[str, Any]:
+    def _create_fingerprint(self, stats: _ScanStats) -> Dict[str, Any]:
         """Create behavioral fingerprint."""
         fingerprint = {
-            "platform_count": len([p for p in platforms.values() if p.found]),
-            "primary_interest": self._identify_primary_interest(platforms),
-            "activity_profile": self._analyze_activity_profile(platforms),
-            "privacy_awareness": self._assess_privacy_awareness(platforms),
-            "monetization_status": self._check_monetization(platforms),
+            "platform_count": len(stats.found),
+            "primary_interest": self._identify_primary_interest(stats),
+            "activity_profile": self._analyze_activity_profile(stats),
+            "privacy_awareness": self._assess_privacy_awareness(stats),
+            "monetization_status": self._check_monetization(stats),
         }
         return fingerprint
 
-    def _identify_primary_interest(self, platforms: Dict[str, PlatformResult]) -> str:
+    def _identify_primary_interest(self, stats: _ScanStats) -> str:
         """Identify primary interest area."""
-        category_counts = defaultdict(int)
-        for result in platforms.values():
-            if result.found:
-                platform_info = PLATFORM_INFO.get(result.platform_id, {})
-                category = platform_info.get("category")
-                if category:
-                    category_counts[category] += 1
-
-        if not category_counts:
+        if not stats.category_counts:
             return "unknown"
 
-        primary = max(category_counts.items(), key=lambda x: x[1])
-        return primary[0]
+        return stats.category_counts.most_common(1)[0][0]
 
-    def _analyze_activity_profile(self, platforms: Dict[str, PlatformResult]) -> str:
+    def _analyze_activity_profile(self, stats: _ScanStats) -> str:
         """Analyze activity profile."""
-        activity_types = defaultdict(int)
-        for result in platforms.values():
-            if result.found:
-                platform_info = PLATFORM_INFO.get(result.platform_id, {})
-                activity = platform_info.get("activity_type")
-                if activity:
-                    activity_types[activity] += 1
-
+        activity_types = stats.activity_counts
         if not activity_types:
             return "inactive"
 
@@ -227,28 +265,15 @@ class AdvancedAnalysisEngine:
             return "multi_interest"
         return "specialized"
 
-    def _assess_privacy_awareness(self, platforms: Dict[str, PlatformResult]) -> str:
+    def _assess_privacy_awareness(self, stats: _ScanStats) -> str:
         """Assess privacy awareness."""
-        configurable_count = sum(
-            1
-            for p in platforms.values()
-            if p.found
-            and PLATFORM_INFO.get(p.platform_id, {}).get("audience") == "configurable"
-        )
-
-        private_count = sum(
-            1
-            for p in platforms.values()
-            if p.found
-            and PLATFORM_INFO.get(p.platform_id, {}).get("audience") != "public"
-        )
-
-        total_found = sum(1 for p in platforms.values() if p.found)
+        total_found = len(stats.found)
 
         if total_found == 0:
             return "not_applicable"
 
-        privacy_ratio = (private_count + configurable_count) / total_found
+        private_count = stats.non_public_count + stats.configurable_count
+        privacy_ratio = private_count / total_found
 
         if privacy_ratio > 0.7:
             return "privacy_conscious"
@@ -256,38 +281,27 @@ class AdvancedAnalysisEngine:
             return "privacy_negligent"
         return "average"
 
-    def _check_monetization(self, platforms: Dict[str, PlatformResult]) -> str:
+    def _check_monetization(self, stats: _ScanStats) -> str:
         """Check monetization presence."""
-        monetization_platforms = ["patreon", "youtube", "twitch", "medium"]
-        found_monetization = [
-            p
-            for p in platforms.values()
-            if p.found and p.platform_id in monetization_platforms
-        ]
-
-        if len(found_monetization) >= 2:
+        if stats.monetization_count >= 2:
             return "active_monetization"
-        if len(found_monetization) == 1:
+        if stats.monetization_count == 1:
             return "partial_monetization"
         return "no_monetization"
 
-    def _detect_anomalies(self, platforms: Dict[str, PlatformResult]) -> List[str]:
+    def _detect_anomalies(self, stats: _ScanStats) -> List[str]:
         """Detect anomalies in profile data."""
         anomalies = []
 
-        response_times = [p.response_time for p in platforms.values() if p.found]
-        if response_times:
-            avg_time = sum(response_times) / len(response_times)
+        if stats.found:
+            threshold = stats.response_time_sum / len(stats.found) * 2
             slow_platforms = [
-                p.platform_name
-                for p in platforms.values()
-                if p.found and p.response_time > avg_time * 2
+                p.platform_name for p in stats.found if p.response_time > threshold
             ]
             if slow_platforms:
                 anomalies.append(f"Slow response from: {', '.join(slow_platforms)}")
 
-        mixed_statuses = any(p.status == "blocked" for p in platforms.values())
-        if mixed_statuses:
+        if stats.blocked:
             anomalies.append("Profile blocking detected - possible account restriction")
 
         return anomalies
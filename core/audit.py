@@ -3,27 +3,58 @@ Audit logging for HandyOsint.
 """
 
 import logging
-import json
+import queue
 import sqlite3
-from typing import List, Dict, Any
+import threading
+import urllib.parse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
 from core.models import AuditLogEntry
+from core.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+_SQL_INSERT_AUDIT = """
+    INSERT INTO audit_logs
+    (timestamp, action, username, scan_id, details, status, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SCAN_HISTORY = """
+    SELECT timestamp, action, scan_id, status
+    FROM audit_logs
+    WHERE username = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
 
 class AuditLogger:
     """Enterprise audit logging."""
 
+    FLUSH_BATCH_SIZE = 256  # Rows written per executemany/COMMIT at most
+    FLUSH_INTERVAL = 0.05  # Seconds the writer waits to grow a partial batch
+
     def __init__(self, db_path: str = "audit.db") -> None:
         """Initialize audit logger."""
         self.db_path = db_path
         self._init_db()
+        # Rows are written by one background thread; None asks it to stop
+        self._queue: "queue.Queue[Optional[Tuple[Any, ...]]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="audit-writer", daemon=True
+        )
+        self._writer.start()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
         logger.info("Audit logger initialized with DB: %s", db_path)
 
     def _init_db(self) -> None:
         """Initialize SQLite database."""
         conn = sqlite3.connect(self.db_path)
+        # WAL is persistent: set it before the writer and reader connect
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -50,57 +81,100 @@ class AuditLogger:
         conn.commit()
         conn.close()
 
+    def _writer_loop(self) -> None:
+        """Drain queued rows in batches over one long-lived connection."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            batch = []
+            item = self._queue.get()
+            taken = 1
+            while True:
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+                if len(batch) >= self.FLUSH_BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.FLUSH_INTERVAL)
+                except queue.Empty:
+                    break
+                taken += 1
+
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(_SQL_INSERT_AUDIT, batch)
+                except Exception as e:  # pylint: disable=broad-except
+                    # One bad batch must not kill the thread and strand the queue
+                    logger.error("Audit logging failed: %s", e)
+            for _ in range(taken):
+                self._queue.task_done()
+        conn.close()
+
     def log(self, entry: AuditLogEntry) -> None:
-        """Log audit entry."""
+        """Queue an audit entry for the background writer."""
+        row = (
+            entry.timestamp,
+            entry.action,
+            entry.username,
+            entry.scan_id,
+            dumps(entry.details),
+            entry.status,
+            entry.error_message,
+        )
+        if self._writer.is_alive():
+            self._queue.put_nowait(row)
+            return
+        # Closed or crashed writer: nothing would drain the queue
+        logger.warning("Audit writer is not running; writing entry directly")
+        conn = sqlite3.connect(self.db_path)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO audit_logs
-                (timestamp, action, username, scan_id, details, status, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.timestamp,
-                entry.action,
-                entry.username,
-                entry.scan_id,
-                json.dumps(entry.details),
-                entry.status,
-                entry.error_message,
-            ))
-
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(_SQL_INSERT_AUDIT, row)
         except sqlite3.Error as e:
             logger.error("Audit logging failed: %s", e)
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        """Block until every queued entry has been committed."""
+        if self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write queued entries and stop the background writer."""
+        if self._writer.is_alive():
+            self._queue.put_nowait(None)
+            self._writer.join()
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _reader_conn(self) -> sqlite3.Connection:
+        """Return the shared read-only connection, opening it on first use."""
+        if self._reader is None:
+            path = urllib.parse.quote(Path(self.db_path).resolve().as_posix())
+            conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            self._reader = conn
+        return self._reader
 
     def get_scan_history(self, username: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get scan history for username."""
+        self.flush()  # Entries still queued for the writer must be visible
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT timestamp, action, scan_id, status
-                FROM audit_logs
-                WHERE username = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (username, limit))
-
-            results = cursor.fetchall()
-            conn.close()
-
-            return [
-                {
-                    "timestamp": r[0],
-                    "action": r[1],
-                    "scan_id": r[2],
-                    "status": r[3],
-                }
-                for r in results
-            ]
+            # WAL lets this read run alongside the writer thread's commits
+            with self._reader_lock:
+                cursor = self._reader_conn().execute(
+                    _SQL_SCAN_HISTORY, (username, limit)
+                )
+                return list(map(dict, cursor))
         except sqlite3.Error as e:
             logger.error("Failed to retrieve scan history: %s", e)
             return []
@@ -2,18 +2,31 @@
 Minimal JWT-based authentication helpers for HandyOsint.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-from jose import jwt
+import jwt
 
 JWT_ALGORITHM = "HS256"
 JWT_SECRET = "CHANGE_ME_HANDYOSINT_SECRET"
 JWT_AUDIENCE = "handyosint-api"
 JWT_ISSUER = "handyosint"
 
+# Encoded once; PyJWT accepts the HMAC key as bytes
+_JWT_KEY = JWT_SECRET.encode()
 
-@dataclass
+TOKEN_CACHE_SIZE = 4096  # Verified tokens remembered until they expire
+
+# blake2b(token) -> (payload, exp); most recently used last
+_token_cache: "OrderedDict[bytes, Tuple[UserPayload, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
 class UserPayload:
     """Minimal user info extracted from the access token."""
 
@@ -22,20 +35,47 @@ class UserPayload:
     scopes: str
 
 
-def verify_access_token(token: str) -> UserPayload:
-    """
-    Decode and validate an access token.
-    """
+def _decode_access_token(token: str) -> Tuple[UserPayload, Dict[str, Any]]:
+    """Fully verify a token and build its payload."""
     decoded: Dict[str, Any] = jwt.decode(
         token,
-        JWT_SECRET,
+        _JWT_KEY,
         algorithms=[JWT_ALGORITHM],
         audience=JWT_AUDIENCE,
         issuer=JWT_ISSUER,
     )
 
-    return UserPayload(
+    payload = UserPayload(
         sub=str(decoded.get("sub", "")),
         username=str(decoded.get("preferred_username", decoded.get("sub", ""))),
         scopes=" ".join(str(decoded.get("scope", "")).split()),
     )
+    return payload, decoded
+
+
+def verify_access_token(token: str) -> UserPayload:
+    """
+    Decode and validate an access token.
+
+    Tokens that verified before are answered from a bounded LRU keyed by a
+    digest of the token, until their ``exp`` claim passes.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            if time.time() < cached[1]:
+                _token_cache.move_to_end(key)
+                return cached[0]
+            del _token_cache[key]
+
+    payload, decoded = _decode_access_token(token)
+
+    exp = decoded.get("exp")
+    if isinstance(exp, (int, float)):
+        # Tokens without an expiry are never cached
+        with _token_cache_lock:
+            _token_cache[key] = (payload, float(exp))
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    return payload
@@ -3,10 +3,11 @@
 CacheManager - In-memory caching with TTL.
 """
 
+import heapq
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,9 @@ class CacheManager:
 
     def __init__(self, ttl_seconds: int = 3600) -> None:
         """Initialize cache manager."""
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._cache: Dict[str, Tuple[Any, float]] = {}  # key -> (value, expires_at)
+        # Min-heap of (expires_at, key); entries go stale when a key is re-set
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.ttl = ttl_seconds
         self._lock = threading.RLock()
         logger.info("Cache initialized with TTL: %ss", ttl_seconds)
@@ -24,11 +27,12 @@ class CacheManager:
     def get(self, key: str) -> Optional[Any]:
         """Get cached value if not expired."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
 
-            value, timestamp = self._cache[key]
-            if time.time() - timestamp > self.ttl:
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
                 del self._cache[key]
                 return None
 
@@ -37,20 +41,30 @@ class CacheManager:
     def set(self, key: str, value: Any) -> None:
         """Set cache value."""
         with self._lock:
-            self._cache[key] = (value, time.time())
+            expires_at = time.monotonic() + self.ttl
+            self._cache[key] = (value, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            # Re-setting hot keys leaves stale heap entries; compact occasionally
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._expiry_heap = [(exp, k) for k, (_, exp) in self._cache.items()]
+                heapq.heapify(self._expiry_heap)
 
     def clear(self) -> None:
         """Clear entire cache."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
 
     def cleanup_expired(self) -> int:
-        """Remove expired entries."""
+        """Remove expired entries, popping only the expired head of the heap."""
         with self._lock:
-            current_time = time.time()
-            expired = [
-                k for k, (_, ts) in self._cache.items() if current_time - ts > self.ttl
-            ]
-            for k in expired:
-                del self._cache[k]
-            return len(expired)
+            now = time.monotonic()
+            heap = self._expiry_heap
+            removed = 0
+            while heap and heap[0][0] < now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                if entry is not None and entry[1] == expires_at:
+                    del self._cache[key]
+                    removed += 1
+            return removed
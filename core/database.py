@@ -0,0 +1,678 @@
+"""
+SQLite persistence for HandyOsint scan results.
+"""
+
+import asyncio
+import functools
+import logging
+import sqlite3
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from core.cache import CacheManager
+from core.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Statements are kept as module constants so every call binds the same string
+# object and hits sqlite3's per-connection prepared statement cache.
+_SQL_INSERT_RESULT = """
+    INSERT INTO scan_results
+    (timestamp, target, platform, status, url, details, scan_type)
+    VALUES (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'), ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_HISTORY = """
+    SELECT id, timestamp, target, platform, status, url, scan_type
+    FROM scan_results
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SQL_SEARCH = """
+    SELECT id, timestamp, target, platform, status, url, scan_type
+    FROM scan_results
+    WHERE target LIKE ? OR url LIKE ?
+    ORDER BY created_at DESC
+"""
+
+_SQL_SEARCH_PAGE = """
+    SELECT id, target, platform, status, COALESCE(url, '')
+    FROM scan_results
+    WHERE target LIKE ? ESCAPE '\\' OR url LIKE ? ESCAPE '\\'
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SQL_SEARCH_COUNT = """
+    SELECT COUNT(*)
+    FROM scan_results
+    WHERE target LIKE ? ESCAPE '\\' OR url LIKE ? ESCAPE '\\'
+"""
+
+# Prefix matches on target alone can range-scan idx_target_platform
+_SQL_PREFIX_PAGE = """
+    SELECT id, target, platform, status, COALESCE(url, '')
+    FROM scan_results
+    WHERE target LIKE ? ESCAPE '\\'
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SQL_PREFIX_COUNT = """
+    SELECT COUNT(*)
+    FROM scan_results
+    WHERE target LIKE ? ESCAPE '\\'
+"""
+
+# Filled with one "?" per submitted target so the lookup seeks idx_target_created
+_SQL_RECENT_TARGETS = """
+    SELECT DISTINCT target
+    FROM scan_results
+    WHERE target IN ({placeholders}) AND created_at >= datetime('now', ?)
+"""
+_RECENT_TARGETS_CHUNK = 500  # Targets per query; stays under SQLite's parameter cap
+
+_SQL_COUNT_SCANS = "SELECT COUNT(*) FROM scan_results"
+_SQL_COUNT_FOUND = "SELECT COUNT(*) FROM scan_results WHERE status = 'FOUND'"
+_SQL_COUNT_TARGETS = "SELECT COUNT(DISTINCT target) FROM scan_results"
+
+_SQL_PLATFORM_COUNTS = """
+    SELECT platform, COUNT(*) as count
+    FROM scan_results
+    GROUP BY platform
+"""
+
+_SQL_TARGET_PROFILES = """
+    SELECT platform, status, url, timestamp, created_at, details
+    FROM scan_results
+    WHERE target = ?
+    ORDER BY created_at DESC
+"""
+
+_SQL_SUMMARY_TOTALS = "SELECT COUNT(*), COUNT(DISTINCT target) FROM scan_results"
+
+_SQL_TOP_TARGETS = """
+    SELECT target, COUNT(DISTINCT platform) as profiles_found_count
+    FROM scan_results
+    WHERE status = 'found'
+    GROUP BY target
+    ORDER BY profiles_found_count DESC, target ASC
+    LIMIT ?
+"""
+
+_SQL_PLATFORM_STATUS_COUNTS = """
+    SELECT platform, status, COUNT(*) as count
+    FROM scan_results
+    GROUP BY platform, status
+    ORDER BY platform, status
+"""
+
+_SQL_RECENT_ACTIVITY = """
+    SELECT target, platform, status, created_at
+    FROM scan_results
+    ORDER BY created_at DESC
+    LIMIT 5
+"""
+
+
+# Blocking query bodies run on the DB thread pool. They live at module scope so
+# a call allocates no per-invocation closure; the pooled connection is passed in.
+
+
+def _db_write_batch(conn: sqlite3.Connection, batch: List[tuple]) -> None:
+    """Insert a batch of result rows in a single transaction."""
+    with conn:
+        conn.executemany(_SQL_INSERT_RESULT, batch)
+
+
+def _db_history(conn: sqlite3.Connection, limit: int) -> List[Dict[str, Any]]:
+    """Return the most recent scan results."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(_SQL_HISTORY, (limit,))
+
+    return [dict(row) for row in cursor]
+
+
+def _db_search(conn: sqlite3.Connection, target: str) -> List[Dict[str, Any]]:
+    """Return scan results whose target or URL contains target."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+
+    pattern = f"%{target}%"
+    cursor.execute(_SQL_SEARCH, (pattern, pattern))
+
+    return [dict(row) for row in cursor]
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so term matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _db_search_page(
+    conn: sqlite3.Connection, target: str, limit: int, prefix: bool
+) -> Tuple[int, List[tuple]]:
+    """Return the match count and the first limit matches as plain tuples."""
+    term = _escape_like(target)
+    if prefix:
+        pattern = f"{term}%"
+        total = conn.execute(_SQL_PREFIX_COUNT, (pattern,)).fetchone()[0]
+        if not total:
+            return 0, []
+        return total, conn.execute(_SQL_PREFIX_PAGE, (pattern, limit)).fetchall()
+
+    pattern = f"%{term}%"
+    total = conn.execute(_SQL_SEARCH_COUNT, (pattern, pattern)).fetchone()[0]
+    if not total:
+        return 0, []
+    rows = conn.execute(_SQL_SEARCH_PAGE, (pattern, pattern, limit)).fetchall()
+    return total, rows
+
+
+def _db_recent_targets(
+    conn: sqlite3.Connection, targets: List[str], ttl: int
+) -> Set[str]:
+    """Return the targets that have a result recorded in the last ttl seconds."""
+    since = f"-{int(ttl)} seconds"
+    recent: Set[str] = set()
+    for start in range(0, len(targets), _RECENT_TARGETS_CHUNK):
+        chunk = targets[start : start + _RECENT_TARGETS_CHUNK]
+        sql = _SQL_RECENT_TARGETS.format(placeholders=", ".join("?" * len(chunk)))
+        recent.update(row[0] for row in conn.execute(sql, (*chunk, since)))
+    return recent
+
+
+def _db_statistics(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Return aggregate scan counts."""
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_COUNT_SCANS)
+    total_scans = cursor.fetchone()[0]
+
+    cursor.execute(_SQL_COUNT_FOUND)
+    found_profiles = cursor.fetchone()[0]
+
+    cursor.execute(_SQL_COUNT_TARGETS)
+    unique_targets = cursor.fetchone()[0]
+
+    cursor.execute(_SQL_PLATFORM_COUNTS)
+    platforms = dict(cursor.fetchall())
+
+    return {
+        "total_scans": total_scans,
+        "found_profiles": found_profiles,
+        "unique_targets": unique_targets,
+        "platforms": platforms,
+    }
+
+
+def _db_target_profiles(conn: sqlite3.Connection, target: str) -> Dict[str, Any]:
+    """Group every stored result for target by platform."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(_SQL_TARGET_PROFILES, (target,))
+
+    correlated_data: Dict[str, Any] = {
+        "target": target,
+        "profiles_by_platform": {},
+        "status_counts": {},
+        "history_summary": [],
+    }
+
+    for row in cursor:
+        platform = row["platform"]
+        status = row["status"]
+
+        if platform not in correlated_data["profiles_by_platform"]:
+            correlated_data["profiles_by_platform"][platform] = []
+
+        correlated_data["profiles_by_platform"][platform].append(
+            {
+                "status": status,
+                "url": row["url"],
+                "timestamp": row["timestamp"],
+                "created_at": row["created_at"],
+                "details": (
+                    loads(row["details"]) if row["details"] else None
+                ),
+            }
+        )
+
+        status_key = status.lower()
+        correlated_data["status_counts"][status_key] = (
+            correlated_data["status_counts"].get(status_key, 0) + 1
+        )
+        correlated_data["history_summary"].append(
+            f"{platform}: {status} on {row['created_at']}"
+        )
+
+    return correlated_data
+
+
+def _db_correlation_summary(
+    conn: sqlite3.Connection, limit_targets: int
+) -> Dict[str, Any]:
+    """Summarize activity across all scanned targets and platforms."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+
+    summary_data: Dict[str, Any] = {
+        "total_scans_recorded": 0,
+        "unique_targets_scanned": 0,
+        "top_targets_by_profiles_found": [],
+        "platforms_activity": {},
+        "status_distribution": {},
+        "recent_activity_overview": [],
+    }
+
+    cursor.execute(_SQL_SUMMARY_TOTALS)
+    (
+        summary_data["total_scans_recorded"],
+        summary_data["unique_targets_scanned"],
+    ) = cursor.fetchone()
+
+    cursor.execute(_SQL_TOP_TARGETS, (limit_targets,))
+    top_targets = [dict(row) for row in cursor]
+    summary_data["top_targets_by_profiles_found"] = top_targets
+
+    # One grouped scan feeds both the per-platform and per-status views
+    cursor.execute(_SQL_PLATFORM_STATUS_COUNTS)
+    status_distribution: Dict[str, int] = {}
+
+    for row in cursor:
+        platform = row["platform"]
+        raw_status = row["status"]
+        status = raw_status.lower()
+        count = row["count"]
+
+        if platform not in summary_data["platforms_activity"]:
+            summary_data["platforms_activity"][platform] = {
+                "total": 0,
+                "found": 0,
+                "not_found": 0,
+                "blocked": 0,
+                "error": 0,
+                "rate_limited": 0,
+            }
+
+        summary_data["platforms_activity"][platform]["total"] += count
+        summary_data["platforms_activity"][platform][status] = (
+            summary_data["platforms_activity"][platform].get(status, 0) + count
+        )
+        status_distribution[raw_status] = status_distribution.get(raw_status, 0) + count
+
+    summary_data["status_distribution"] = dict(
+        sorted(status_distribution.items(), key=lambda item: -item[1])
+    )
+
+    cursor.execute(_SQL_RECENT_ACTIVITY)
+    summary_data["recent_activity_overview"] = [dict(row) for row in cursor]
+
+    return summary_data
+
+
+class DatabaseManager:
+    """SQLite database operations with async support."""
+
+    FLUSH_BATCH_SIZE = 64  # Queued results that trigger an immediate flush
+    FLUSH_INTERVAL = 0.5  # Seconds a partial batch may wait before flushing
+    EXECUTOR_WORKERS = 4  # Dedicated DB threads, each holding one connection
+    READ_CACHE_TTL = 30  # Seconds an aggregate query result may be reused
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        """Initialize database manager."""
+        self.db_path = db_path or _PROJECT_ROOT / "data" / "handyosint.db"
+        self.db_path.parent.mkdir(exist_ok=True)
+        self._tls = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: Optional[asyncio.Task] = None
+        # Aggregate reads are cached until the TTL lapses or new rows are written
+        self._read_cache = CacheManager(ttl_seconds=self.READ_CACHE_TTL)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.EXECUTOR_WORKERS, thread_name_prefix="db"
+        )
+        self._init_database_sync()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # page_size only takes effect on a fresh file, before WAL is enabled
+            conn.execute("PRAGMA page_size=8192")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._tls.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _ro_conn(self) -> sqlite3.Connection:
+        """Return the calling thread's read-only, shared-cache connection."""
+        conn = getattr(self._tls, "ro_conn", None)
+        if conn is None:
+            path = urllib.parse.quote(self.db_path.resolve().as_posix())
+            conn = sqlite3.connect(
+                f"file:{path}?mode=ro&cache=shared",
+                uri=True,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._tls.ro_conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    async def connect(self) -> None:
+        """Open a warm read-write connection on every DB thread up front."""
+        barrier = threading.Barrier(self.EXECUTOR_WORKERS)
+
+        def _open() -> None:
+            # The barrier holds each job until all workers have one, so every
+            # thread in the pool opens its own connection exactly once.
+            barrier.wait()
+            self._conn()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _open)
+                for _ in range(self.EXECUTOR_WORKERS)
+            )
+        )
+
+    def close(self) -> None:
+        """Write queued results and close every pooled connection."""
+        if self._flush_timer and not self._flush_timer.done():
+            self._flush_timer.cancel()
+        if self._pending:
+            batch, self._pending = self._pending, []
+            _db_write_batch(self._conn(), batch)
+        self._executor.shutdown(wait=True)
+
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._tls = threading.local()
+
+    def _init_database_sync(self) -> None:
+        """Initialize database schema synchronously."""
+        try:
+            conn = self._conn()
+            cursor = conn.cursor()
+
+            # Scan results table
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scan_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    platform TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    url TEXT,
+                    details TEXT,
+                    scan_type TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+
+            # Batch jobs table
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS batch_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    targets TEXT NOT NULL,
+                    status TEXT DEFAULT 'pending',
+                    total_scans INTEGER,
+                    completed_scans INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP
+                )
+                """
+            )
+
+            # Create indexes
+            # idx_target is superseded by the (target, created_at) composite
+            cursor.execute("DROP INDEX IF EXISTS idx_target")
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_target_created
+                ON scan_results(target, created_at DESC)
+                """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_status_platform
+                ON scan_results(status, platform)
+                """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_created
+                ON scan_results(created_at DESC)
+                """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_target_platform
+                ON scan_results(target COLLATE NOCASE, platform)
+                """
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_timestamp ON scan_results(timestamp)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_platform ON scan_results(platform)"
+            )
+
+            conn.commit()
+            logger.info("Database initialized: %s", self.db_path)
+
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Database initialization failed: %s", exc)
+            raise
+
+    async def _execute_db_operation(
+        self, func: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run func(conn, *args) on the DB thread pool with that thread's connection."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(self._call_with_conn, func, *args, **kwargs),
+        )
+
+    def _call_with_conn(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Invoke func with the current DB thread's pooled connection."""
+        return func(self._conn(), *args, **kwargs)
+
+    async def _execute_db_read(self, func: Callable, *args: Any) -> Any:
+        """Run a pure reader func(conn, *args) on a read-only connection."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(self._call_with_ro_conn, func, *args)
+        )
+
+    def _call_with_ro_conn(self, func: Callable, *args: Any) -> Any:
+        """Invoke func with the current DB thread's read-only connection."""
+        return func(self._ro_conn(), *args)
+
+    async def save_result(
+        self,
+        target: str,
+        platform: str,
+        status: str,  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        url: str = "",
+        scan_type: str = "",
+        details: Optional[Dict] = None,
+    ) -> bool:
+        """Queue scan result; rows are written in batches by flush()."""
+        self._pending.append(
+            (
+                target,
+                platform,
+                status,
+                url,
+                dumps(details or {}),
+                scan_type,
+            )
+        )
+
+        if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+            return await self.flush()
+
+        if self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = asyncio.create_task(self._flush_after_interval())
+        return True
+
+    async def save_results_bulk(
+        self, rows: List[Tuple[str, str, str, str, str, Optional[Dict]]]
+    ) -> bool:
+        """Write (target, platform, status, url, scan_type, details) rows at once.
+
+        The rows join anything already queued and are written by a single
+        flush(), i.e. one executemany inside one transaction.
+        """
+        self._pending.extend(
+            (target, platform, status, url, dumps(details or {}), scan_type)
+            for target, platform, status, url, scan_type, details in rows
+        )
+        return await self.flush()
+
+    async def _flush_after_interval(self) -> None:
+        """Flush whatever is queued once the batching window has elapsed."""
+        await asyncio.sleep(self.FLUSH_INTERVAL)
+        await self.flush()
+
+    async def flush(self) -> bool:
+        """Write all queued scan results asynchronously."""
+        async with self._flush_lock:
+            if not self._pending:
+                return True
+            batch, self._pending = self._pending, []
+
+            try:
+                await self._execute_db_operation(_db_write_batch, batch)
+                self._read_cache.clear()
+                logger.info("Saved %d results", len(batch))
+                return True
+            except (sqlite3.Error, OSError) as exc:
+                logger.error("Failed to save %d results: %s", len(batch), exc)
+                return False
+
+    async def get_scan_history(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Retrieve scan history asynchronously."""
+        try:
+            await self.flush()
+            return await self._execute_db_operation(_db_history, limit)
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Failed to retrieve history: %s", exc)
+            return []
+
+    async def search_results(self, target: str) -> List[Dict[str, Any]]:
+        """Search results by target asynchronously."""
+        try:
+            await self.flush()
+            return await self._execute_db_operation(_db_search, target)
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Search failed: %s", exc)
+            return []
+
+    async def search_results_page(
+        self, target: str, limit: int = 10, prefix: bool = False
+    ) -> Tuple[int, List[tuple]]:
+        """Count matches for target and fetch (id, target, platform, status, url).
+
+        By default target is searched for anywhere in targets and URLs;
+        prefix=True matches the start of the target only, using the index.
+        """
+        try:
+            await self.flush()
+            return await self._execute_db_operation(
+                _db_search_page, target, limit, prefix
+            )
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Search failed: %s", exc)
+            return 0, []
+
+    async def get_recent_targets(
+        self, targets: List[str], ttl: int = 3600
+    ) -> Set[str]:
+        """Get which of targets were scanned within the last ttl seconds."""
+        if not targets:
+            return set()
+        try:
+            await self.flush()
+            return await self._execute_db_operation(_db_recent_targets, targets, ttl)
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Recent target lookup failed: %s", exc)
+            return set()
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get database statistics asynchronously."""
+        try:
+            await self.flush()
+            stats = self._read_cache.get("statistics")
+            if stats is None:
+                stats = await self._execute_db_operation(_db_statistics)
+                self._read_cache.set("statistics", stats)
+            return stats
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Statistics retrieval failed: %s", exc)
+            return {}
+
+    async def get_correlated_target_profiles(self, target: str) -> Dict[str, Any]:
+        """Retrieve and correlate all scan results for target across platforms."""
+        try:
+            await self.flush()
+            key = f"profiles:{target}"
+            profiles = self._read_cache.get(key)
+            if profiles is None:
+                profiles = await self._execute_db_read(_db_target_profiles, target)
+                self._read_cache.set(key, profiles)
+            return profiles
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Correlation query failed for target %s: %s", target, exc)
+            return {
+                "target": target,
+                "profiles_by_platform": {},
+                "status_counts": {},
+                "history_summary": [],
+                "error": str(exc),
+            }
+
+    async def get_overall_correlation_summary(
+        self, limit_targets: int = 10
+    ) -> Dict[str, Any]:
+        """Provide overall correlation summary across all scanned targets."""
+        try:
+            await self.flush()
+            key = f"summary:{limit_targets}"
+            summary = self._read_cache.get(key)
+            if summary is None:
+                summary = await self._execute_db_read(
+                    _db_correlation_summary, limit_targets
+                )
+                self._read_cache.set(key, summary)
+            return summary
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Overall correlation summary query failed: %s", exc)
+            return {"error": str(exc)}
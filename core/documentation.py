@@ -2,15 +2,28 @@
 Integrated README.md viewer for command center
 """
 
+import json
 import logging
 from pathlib import Path
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Section key -> "## " heading prefix it is read from
+_README_SECTIONS = (
+    ("about", "About"),
+    ("features", "Features"),
+    ("usage", "Usage"),
+    ("installation", "Installation"),
+    ("license", "License"),
+)
+
 
 class IntegratedDocumentation:  # pylint: disable=R0903
     """Interactive documentation from README.md"""
 
+    CACHE_VERSION = 2  # Bump when the parsed section layout changes
+
     def __init__(self, readme_path="README.md"):
         self.readme_path = Path(readme_path)
         self.sections = self._parse_readme()
@@ -23,38 +36,66 @@ class IntegratedDocumentation:  # pylint: disable=R0903
             )
             return self._get_default_sections()
 
+        # Warm start: reuse the sidecar while it is newer than README.md
+        cached = self._load_cached_sections()
+        if cached is not None:
+            return cached
+
         try:
             with open(self.readme_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            # Parse sections (simplified - you can enhance this)
-            sections = {
-                "about": self._extract_section(content, "About", "## "),
-                "features": self._extract_section(content, "Features", "## "),
-                "usage": self._extract_section(content, "Usage", "## "),
-                "installation": self._extract_section(content, "Installation", "## "),
-                "license": self._extract_section(content, "License", "## "),
-            }
+            sections = self._parse_all_sections(content)
+            self._write_cached_sections(sections)
             return sections
         except (IOError, OSError) as e:
             logger.error("Error parsing README.md: %s", e, exc_info=True)
             return self._get_default_sections()
 
-    def _extract_section(self, content, section_name, delimiter):
-        """Extract specific section from markdown"""
-        # Simplified extraction - can be enhanced with proper markdown parsing
-        lines = content.split("\n")
-        in_section = False
-        section_lines = []
-
-        for line in lines:
-            if line.startswith(f"{delimiter}{section_name}"):
-                in_section = True
-                continue
-            if in_section and line.startswith(delimiter):
-                break
-            if in_section:
-                section_lines.append(line)
+    def _cache_path(self) -> Path:
+        return self.readme_path.with_suffix(".sections.json")
+
+    def _load_cached_sections(self) -> Optional[dict]:
+        """Return the cached sections if the sidecar is at least as new as README.md"""
+        cache_path = self._cache_path()
+        try:
+            if cache_path.stat().st_mtime < self.readme_path.stat().st_mtime:
+                return None
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != self.CACHE_VERSION:
+            return None
+        sections = cached.get("sections")
+        return sections if isinstance(sections, dict) else None
+
+    def _write_cached_sections(self, sections: dict) -> None:
+        payload = {"version": self.CACHE_VERSION, "sections": sections}
+        try:
+            self._cache_path().write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write README cache %s: %s", self._cache_path(), e)
+
+    def _parse_all_sections(self, content: str) -> dict:
+        """Split markdown into the known sections in a single pass over its lines"""
+        collected: Dict[str, List[str]] = {}
+        current = None
+        for line in content.splitlines():
+            if line.startswith("## "):
+                # A level-2 heading ends the open section; it may start a new one
+                heading = line[3:]
+                current = None
+                for key, title in _README_SECTIONS:
+                    if key not in collected and heading.startswith(title):
+                        current = collected[key] = []
+                        break
+            elif current is not None:
+                current.append(line)
+
+        sections = dict.fromkeys(key for key, _ in _README_SECTIONS)
+        for key, lines in collected.items():
+            sections[key] = "\n".join(lines)
+        return sections
 
     def _get_default_sections(self):
         """Default documentation if README not found"""
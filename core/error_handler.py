@@ -13,11 +13,13 @@ import logging
 import sys
 import time
 import traceback
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 # ========================================================================
 # EXCEPTION HIERARCHY
@@ -265,8 +267,18 @@ class ErrorHandler:  # pylint: disable=R0904
             "HandyOsintErrors", self.log_dir / "errors.log"
         )
 
-        self.error_history: List[ErrorLogEntry] = []
+        # Severity -> bound log call, resolved once instead of per error
+        self._severity_dispatch: Dict[ErrorSeverity, Callable[[str], None]] = {
+            ErrorSeverity.INFO: self.logger.info,
+            ErrorSeverity.WARNING: self.logger.warning,
+            ErrorSeverity.ERROR: self.error_logger.error,
+            ErrorSeverity.CRITICAL: self.error_logger.critical,
+            ErrorSeverity.FATAL: partial(self.error_logger.critical, "FATAL: %s"),
+        }
+
         self.max_history = 1000
+        # Oldest entries fall off the left once max_history is reached
+        self.error_history: Deque[ErrorLogEntry] = deque(maxlen=self.max_history)
 
         self.logger.info("ErrorHandler initialized")
 
@@ -281,21 +293,8 @@ class ErrorHandler:  # pylint: disable=R0904
         entry = ErrorLogEntry(exception, severity, context, recovery)
         self.error_history.append(entry)
 
-        if len(self.error_history) > self.max_history:
-            self.error_history = self.error_history[-self.max_history :]
-
         log_msg = f"{entry.exception_type}: {entry.message}"
-
-        if severity == ErrorSeverity.INFO:
-            self.logger.info(log_msg)
-        elif severity == ErrorSeverity.WARNING:
-            self.logger.warning(log_msg)
-        elif severity == ErrorSeverity.ERROR:
-            self.error_logger.error(log_msg)
-        elif severity == ErrorSeverity.CRITICAL:
-            self.error_logger.critical(log_msg)
-        elif severity == ErrorSeverity.FATAL:
-            self.error_logger.critical("FATAL: %s", log_msg)
+        self._severity_dispatch[severity](log_msg)
 
         return entry
 
@@ -502,9 +501,14 @@ class ErrorHandler:  # pylint: disable=R0904
     # ERROR HISTORY & REPORTING
     # ====================================================================
 
+    def _recent_errors(self, limit: int) -> List[ErrorLogEntry]:
+        """Return the newest ``limit`` entries, oldest first."""
+        start = max(0, len(self.error_history) - limit)
+        return list(islice(self.error_history, start, None))
+
     def get_error_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get error history."""
-        return [entry.to_dict() for entry in self.error_history[-limit:]]
+        return [entry.to_dict() for entry in self._recent_errors(limit)]
 
     def get_error_summary(self) -> Dict[str, Any]:
         """Get summary of errors."""
@@ -523,7 +527,7 @@ class ErrorHandler:  # pylint: disable=R0904
             exc_type = entry.exception_type
             summary["by_type"][exc_type] = summary["by_type"].get(exc_type, 0) + 1
 
-        summary["recent"] = [entry.to_dict() for entry in self.error_history[-5:]]
+        summary["recent"] = [entry.to_dict() for entry in self._recent_errors(5)]
 
         return summary
 
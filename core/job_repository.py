@@ -4,7 +4,6 @@ Async job persistence layer for HandyOsint using SQLite.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 import aiosqlite
 
+from core.serialization import dumps, loads
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = _PROJECT_ROOT / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -147,7 +148,7 @@ class JobRepository:
                 result["profile_url"],
                 result["confidence"],
                 result["response_time_ms"],
-                json.dumps(result["metadata"]),
+                dumps(result["metadata"]),
                 result["error"],
             ),
         )
@@ -179,7 +180,7 @@ class JobRepository:
                     "profile_url": row[2],
                     "confidence": row[3],
                     "response_time_ms": row[4],
-                    "metadata": json.loads(row[5]) if row[5] else {},
+                    "metadata": loads(row[5]) if row[5] else {},
                     "error": row[6],
                 }
             )
@@ -12,18 +12,33 @@ Advanced OSINT platform reconnaissance with:
 """
 
 import asyncio
-import collections
+import codecs
+import inspect
+import itertools
 import logging
 import random
+import socket
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+from urllib.parse import urlsplit
 
 import aiohttp
 
 from config.platforms import PLATFORM_INFO
+from core.serialization import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +47,21 @@ logger = logging.getLogger(__name__)
 # DATA MODELS
 # ========================================================================
 
+# (epoch, isoformat) of the last timestamp handed out by _now_iso()
+_LAST_TS: List[Any] = [0.0, ""]
+_TS_RESOLUTION = 0.05  # Seconds a formatted timestamp is reused for
+
+
+def _now_iso() -> str:
+    """Return datetime.now().isoformat(), reusing the string within 50 ms."""
+    now = time.time()
+    if 0.0 <= now - _LAST_TS[0] < _TS_RESOLUTION:
+        return _LAST_TS[1]
+    stamp = datetime.fromtimestamp(now).isoformat()
+    _LAST_TS[0], _LAST_TS[1] = now, stamp
+    return stamp
+
+
 
 class ScanStatus(Enum):
     """Platform scan status indicators."""
@@ -56,7 +86,7 @@ class PlatformCategory(Enum):
 
 
 # pylint: disable=R0902
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlatformConfig:
     """Platform configuration with validation rules."""
 
@@ -64,23 +94,33 @@ class PlatformConfig:
     url_template: str
     category: PlatformCategory
     check_method: str = "status_code"
-    valid_codes: List[int] = field(default_factory=lambda: [200])
-    not_found_codes: List[int] = field(default_factory=lambda: [404])
-    blocked_codes: List[int] = field(default_factory=lambda: [403])
+    method: str = "GET"  # HEAD when the status code alone decides the result
+    valid_codes: FrozenSet[int] = frozenset({200})
+    not_found_codes: FrozenSet[int] = frozenset({404})
+    blocked_codes: FrozenSet[int] = frozenset({403})
     timeout: float = 10.0
-    custom_validator: Optional[callable] = None
+    custom_validator: Optional[Callable[[str], bool]] = None
     max_retries: int = 2
+    max_body_bytes: int = 8192  # Body prefix handed to custom_validator
+    url_prefix: str = field(default="", init=False, repr=False)
+    url_suffix: str = field(default="", init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration."""
-        if not self.valid_codes:
-            self.valid_codes = [200]
-        if not self.not_found_codes:
-            self.not_found_codes = [404]
+        # Frozen, so normalize through object.__setattr__. Accept any iterable
+        # of codes; store frozensets for O(1) membership
+        setattr_ = object.__setattr__
+        setattr_(self, "valid_codes", frozenset(self.valid_codes or (200,)))
+        setattr_(self, "not_found_codes", frozenset(self.not_found_codes or (404,)))
+        setattr_(self, "blocked_codes", frozenset(self.blocked_codes))
+        # Split once so building a profile URL is plain concatenation
+        prefix, _, suffix = self.url_template.partition("{username}")
+        setattr_(self, "url_prefix", prefix)
+        setattr_(self, "url_suffix", suffix)
 
 
 # pylint: disable=R0902
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScanResultDetail:
     """Individual platform scan result."""
 
@@ -93,11 +133,22 @@ class ScanResultDetail:
     found: bool = False
     content_preview: str = ""
     error: Optional[str] = None
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (all fields are scalars, so no deep copy)."""
+        return {
+            "platform": self.platform,
+            "platform_id": self.platform_id,
+            "url": self.url,
+            "status": self.status,
+            "status_code": self.status_code,
+            "response_time": self.response_time,
+            "found": self.found,
+            "content_preview": self.content_preview,
+            "error": self.error,
+            "timestamp": self.timestamp,
+        }
 
 
 # pylint: disable=R0902
@@ -106,7 +157,7 @@ class UsernameSearchResult:
     """Complete username search result across platforms."""
 
     username: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
     total_platforms: int = 0
     profiles_found: int = 0
     scan_duration: float = 0.0
@@ -129,8 +180,10 @@ class UsernameSearchResult:
             "statistics": self.statistics,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON, using orjson when it is installed."""
+        return dumps_bytes(self.to_dict())
 
-# ... (rest of imports remain)
 
 # ========================================================================
 # CUSTOM VALIDATORS
@@ -202,9 +255,71 @@ class ScannerConfig:  # pylint: disable=R0903
         return ScannerConfig.USER_AGENTS
 
 
+class TokenBucket:  # pylint: disable=R0903
+    """Async token-bucket rate limiter: ``rate`` tokens/s, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Start with a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping only for the deficit when the bucket is empty."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self.last_refill is not None:
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last_refill) * self.rate
+                )
+            self.last_refill = now
+            if self.tokens < 1.0:
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.last_refill = loop.time()
+            self.tokens -= 1.0
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Disable Nagle and enable keepalive on a scanner connection."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+def _nodelay_socket(addr_info: tuple) -> socket.socket:
+    """``TCPConnector(socket_factory=...)`` hook creating pre-tuned sockets."""
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    _tune_socket(sock)
+    return sock
+
+
+class _NoDelayConnector(aiohttp.TCPConnector):
+    """Fallback for aiohttp without ``socket_factory``: tune after connect."""
+
+    async def _wrap_create_connection(self, *args: Any, **kwargs: Any) -> Any:
+        transport, protocol = await super()._wrap_create_connection(*args, **kwargs)
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            _tune_socket(sock)
+        return transport, protocol
+
+
+_HAS_SOCKET_FACTORY = (
+    "socket_factory" in inspect.signature(aiohttp.TCPConnector).parameters
+)
+
+
 class ProductionScanner:  # pylint: disable=R0902,too-many-public-methods,R0903
     """Enterprise OSINT scanner with real HTTP requests."""
 
+    RATE_LIMIT_PER_SECOND = 2.0  # Token refill rate per platform
+    RATE_LIMIT_BURST = 5  # Requests a platform may take back-to-back
+    RETRY_BACKOFF = 0.5  # Seconds before the first retry; doubles per attempt
+
     def __init__(  # pylint: disable=R0913,R0917
         self,
         max_concurrent: int = 10,
@@ -217,20 +332,629 @@ class ProductionScanner:  # pylint: disable=R0902,too-many-public-methods,R0903
         """Initialize the ProductionScanner."""
         self.max_concurrent = max_concurrent
         self.timeout = timeout
-        self.proxy_pool = (
-            collections.deque(proxy_pool) if proxy_pool else collections.deque()
-        )
+        self.proxy_pool: Tuple[str, ...] = tuple(proxy_pool or ())
+        self._proxy_idx = 0
         self.user_agents = user_agents or ScannerConfig.get_user_agents()
+        # Per-instance RNG (no shared module state): each scanner starts its
+        # User-Agent rotation at a different offset
+        self._rng = random.Random()
+        offset = self._rng.randrange(len(self.user_agents))
+        self._ua_cycle = itertools.cycle(
+            self.user_agents[offset:] + self.user_agents[:offset]
+        )
+        self._base_headers = ScannerConfig.get_default_headers()
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.platforms: Dict[str, PlatformConfig] = {}
-        self.rate_limiters: Dict[str, float] = (
-            {}
-        )  # {platform_id: last_request_timestamp}
+        self._platform_info_static: Dict[str, Any] = {}
+        self.rate_limiters: Dict[str, TokenBucket] = {}  # {platform name: bucket}
         self.session: Optional[aiohttp.ClientSession] = (
             None  # Initialized in _ensure_session
         )
         self.request_count: int = 0  # Requests in current session
         self.total_requests: int = 0  # Total requests across all sessions
+        self._warmup_task: Optional[asyncio.Task] = None
+
+        self._init_platforms()
+
+        logger.info(
+            "ProductionScanner initialized with %d platforms",
+            len(self.platforms)
+        )
+
+    def _init_platforms(self) -> None:
+        """Initialize platform configurations."""
+        platforms_data = [
+            ("twitter", "Twitter/X", "https://twitter.com/{username}",
+             PlatformCategory.SOCIAL_MEDIA, validate_twitter),
+            ("instagram", "Instagram", "https://instagram.com/{username}",
+             PlatformCategory.SOCIAL_MEDIA, validate_instagram),
+            ("tiktok", "TikTok", "https://tiktok.com/@{username}",
+             PlatformCategory.SOCIAL_MEDIA, validate_tiktok),
+            ("reddit", "Reddit", "https://reddit.com/user/{username}",
+             PlatformCategory.SOCIAL_MEDIA, None),
+            ("linkedin", "LinkedIn", "https://linkedin.com/in/{username}",
+             PlatformCategory.PROFESSIONAL, None),
+            ("snapchat", "Snapchat", "https://snapchat.com/add/{username}",
+             PlatformCategory.SOCIAL_MEDIA, None),
+            ("telegram", "Telegram", "https://t.me/{username}",
+             PlatformCategory.MESSAGING, None),
+            ("github", "GitHub", "https://github.com/{username}",
+             PlatformCategory.DEVELOPER, validate_github),
+            ("gitlab", "GitLab", "https://gitlab.com/{username}",
+             PlatformCategory.DEVELOPER, None),
+            ("stackoverflow", "Stack Overflow",
+             "https://stackoverflow.com/users/{username}",
+             PlatformCategory.DEVELOPER, None),
+            ("dev_to", "Dev.to", "https://dev.to/{username}",
+             PlatformCategory.DEVELOPER, None),
+            ("codepen", "CodePen", "https://codepen.io/{username}",
+             PlatformCategory.DEVELOPER, None),
+            ("youtube", "YouTube", "https://youtube.com/@{username}",
+             PlatformCategory.CONTENT, None),
+            ("twitch", "Twitch", "https://twitch.tv/{username}",
+             PlatformCategory.CONTENT, None),
+            ("medium", "Medium", "https://medium.com/@{username}",
+             PlatformCategory.CONTENT, None),
+            ("pinterest", "Pinterest", "https://pinterest.com/{username}",
+             PlatformCategory.CONTENT, None),
+            ("spotify", "Spotify", "https://open.spotify.com/user/{username}",
+             PlatformCategory.CONTENT, None),
+            ("patreon", "Patreon", "https://patreon.com/{username}",
+             PlatformCategory.OTHER, None),
+            ("mastodon", "Mastodon", "https://mastodon.social/@{username}",
+             PlatformCategory.SOCIAL_MEDIA, None),
+            ("bluesky", "Bluesky", "https://bsky.app/profile/{username}",
+             PlatformCategory.SOCIAL_MEDIA, None),
+            ("threads", "Threads", "https://threads.net/@{username}",
+             PlatformCategory.SOCIAL_MEDIA, None),
+        ]
+
+        for platform_id, name, url, category, validator in platforms_data:
+            self.platforms[platform_id] = PlatformConfig(
+                name=name,
+                url_template=url,
+                category=category,
+                check_method="content" if validator else "status_code",
+                method="GET" if validator else "HEAD",
+                custom_validator=validator,
+            )
+            self.rate_limiters[name] = TokenBucket(
+                rate=self.RATE_LIMIT_PER_SECOND, capacity=self.RATE_LIMIT_BURST
+            )
+
+        self._platform_info_static = self._build_platform_info()
+
+    def _build_platform_info(self) -> Dict[str, Any]:
+        """Group configured platforms by category (platforms are fixed after init)."""
+        categories: Dict[str, List[Dict[str, str]]] = {}
+        for platform_id, config in self.platforms.items():
+            categories.setdefault(config.category.value, []).append(
+                {"id": platform_id, "name": config.name}
+            )
+        return {
+            "total_platforms": len(self.platforms),
+            "categories": categories,
+        }
+
+    def _get_next_proxy(self) -> Optional[str]:
+        """Get next proxy from pool in round-robin fashion."""
+        if not self.proxy_pool:
+            return None
+        idx = self._proxy_idx
+        self._proxy_idx = (idx + 1) % len(self.proxy_pool)
+        return self.proxy_pool[idx]
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Ensure HTTP session is initialized and return it."""
+        if self.session is None or self.session.closed:
+            # Long-lived pool: cache DNS and keep idle sockets so repeat scans
+            # of the same hosts skip the TCP/TLS handshake
+            connector_kwargs: Dict[str, Any] = {
+                "limit": self.max_concurrent * 4,
+                "limit_per_host": 10,
+                "use_dns_cache": True,
+                "ttl_dns_cache": 300,
+                "keepalive_timeout": 75,
+                "enable_cleanup_closed": True,
+                "force_close": False,
+            }
+            # Small GETs: send without waiting on Nagle/delayed-ACK
+            if _HAS_SOCKET_FACTORY:
+                connector = aiohttp.TCPConnector(
+                    socket_factory=_nodelay_socket, **connector_kwargs
+                )
+            else:
+                connector = _NoDelayConnector(**connector_kwargs)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                trust_env=True,
+            )
+            logger.info("HTTP session initialized")
+        return self.session
+
+    async def _prefetch_dns(self) -> None:
+        """Resolve every distinct platform host concurrently."""
+        if self.proxy_pool:
+            # Proxies resolve the targets themselves; local lookups would
+            # only leak which hosts are about to be scanned
+            return
+        hosts = {urlsplit(p.url_prefix).hostname for p in self.platforms.values()}
+        hosts.discard(None)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.getaddrinfo(h, 443, type=socket.SOCK_STREAM) for h in hosts),
+            return_exceptions=True,
+        )
+
+    async def _warm_connections(self) -> None:
+        """Open a pooled connection to every platform host ahead of the first scan."""
+        if self.proxy_pool:
+            # Scans go out through the proxies; a direct warm-up would
+            # contact every target from this host's own address
+            return
+        session = await self._ensure_session()
+
+        async def _head(platform: PlatformConfig) -> None:
+            # The HEAD counts against the host's budget like any scan request
+            await self.rate_limiters[platform.name].acquire()
+            async with session.head(
+                platform.url_prefix,
+                headers=self._prepare_headers(),
+                allow_redirects=False,
+            ):
+                pass
+
+        await asyncio.gather(
+            *(_head(p) for p in self.platforms.values()),
+            return_exceptions=True,
+        )
+        logger.debug("Warmed connections to %d platforms", len(self.platforms))
+
+    def _prepare_headers(self) -> Dict[str, str]:
+        """Prepare request headers with the next User-Agent in rotation."""
+        return {**self._base_headers, "User-Agent": next(self._ua_cycle)}
+
+    @staticmethod
+    async def _read_body_prefix(
+        response: aiohttp.ClientResponse, limit: int
+    ) -> bytes:
+        """Read up to ``limit`` body bytes; a single read() stops at the first chunk."""
+        body = bytearray()
+        while len(body) < limit:
+            chunk = await response.content.read(limit - len(body))
+            if not chunk:
+                break
+            body += chunk
+        return bytes(body)
+
+    @staticmethod
+    def _body_charset(response: aiohttp.ClientResponse) -> str:
+        """Return the declared charset, or utf-8 when Python has no such codec."""
+        charset = response.charset or "utf-8"
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            return "utf-8"
+        return charset
+
+    def _determine_status(
+        self,
+        response_status: int,
+        content: str,
+        platform: PlatformConfig
+    ) -> tuple:
+        """Determine scan status based on response and content."""
+        if platform.custom_validator:
+            is_valid = platform.custom_validator(content)
+            return (
+                ScanStatus.FOUND.value if is_valid else ScanStatus.NOT_FOUND.value,
+                is_valid,
+                None
+            )
+
+        if response_status in platform.valid_codes:
+            return ScanStatus.FOUND.value, True, None
+        if response_status in platform.not_found_codes:
+            return ScanStatus.NOT_FOUND.value, False, None
+        if response_status in platform.blocked_codes:
+            error = f"Access Denied (HTTP {response_status})"
+            return ScanStatus.BLOCKED.value, False, error
+        if response_status == 429:
+            return ScanStatus.RATE_LIMITED.value, False, None
+
+        error = f"HTTP {response_status}"
+        return ScanStatus.ERROR.value, False, error
+
+    async def _make_request(  # pylint: disable=R0914
+        self,
+        url: str,
+        platform: PlatformConfig,
+    ) -> ScanResultDetail:
+        """Make HTTP request with retry logic and error handling."""
+        clock = asyncio.get_running_loop().time  # Monotonic, no wall-clock jumps
+        session = await self._ensure_session()
+        await self.rate_limiters[platform.name].acquire()
+        headers = self._prepare_headers()
+        failure: Optional[ScanResultDetail] = None
+
+        for attempt in range(platform.max_retries + 1):
+            start_time = clock()
+            try:
+                proxy_url = self._get_next_proxy()
+
+                response = await session.request(
+                    platform.method,
+                    url,
+                    headers=headers,
+                    allow_redirects=True,
+                    proxy=proxy_url
+                )
+                if response.status == 405 and platform.method == "HEAD":
+                    # Host refuses HEAD; ask again with a plain GET
+                    response.release()
+                    response = await session.get(
+                        url,
+                        headers=headers,
+                        allow_redirects=True,
+                        proxy=proxy_url
+                    )
+
+                async with response:
+                    response_time = clock() - start_time
+                    self.request_count += 1
+                    self.total_requests += 1
+
+                    content = ""
+                    # Status-code platforms never look at the body; validators
+                    # only need the head of the page, not the whole document
+                    if platform.custom_validator:
+                        try:
+                            raw = await self._read_body_prefix(
+                                response, platform.max_body_bytes
+                            )
+                            content = raw.decode(
+                                self._body_charset(response), errors="replace"
+                            )
+                        except aiohttp.ClientPayloadError as read_err:
+                            logger.error(
+                                "Error reading content from %s: %s",
+                                platform.name,
+                                str(read_err)
+                            )
+
+                    status, found, error = self._determine_status(
+                        response.status,
+                        content,
+                        platform
+                    )
+
+                    result = ScanResultDetail(
+                        platform=platform.name,
+                        platform_id=platform.name,
+                        # Only stringify the yarl URL when a redirect changed it
+                        url=str(response.url) if response.history else url,
+                        status=status,
+                        status_code=response.status,
+                        response_time=response_time,
+                        found=found,
+                        content_preview=content[:500],
+                        error=error,
+                    )
+
+                    logger.info(
+                        "Scanned %s: %s",
+                        platform.name,
+                        status
+                    )
+                    return result
+
+            except asyncio.TimeoutError:
+                failure = ScanResultDetail(
+                    platform=platform.name,
+                    platform_id=platform.name,
+                    url=url,
+                    status=ScanStatus.TIMEOUT.value,
+                    response_time=clock() - start_time,
+                    error="Request timeout",
+                )
+
+            except aiohttp.ClientError as client_err:
+                failure = ScanResultDetail(
+                    platform=platform.name,
+                    platform_id=platform.name,
+                    url=url,
+                    status=ScanStatus.ERROR.value,
+                    response_time=clock() - start_time,
+                    error=f"Network error: {str(client_err)}",
+                )
+
+            except (KeyError, ValueError) as err:
+                logger.error(
+                    "Error scanning %s: %s",
+                    platform.name,
+                    str(err)
+                )
+
+                return ScanResultDetail(
+                    platform=platform.name,
+                    platform_id=platform.name,
+                    url=url,
+                    status=ScanStatus.ERROR.value,
+                    response_time=clock() - start_time,
+                    error=f"Scan error: {str(err)}",
+                )
+
+            if attempt < platform.max_retries:
+                await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+
+        # Every attempt either returned a result or recorded its failure
+        return cast(ScanResultDetail, failure)
+
+    async def scan_platform(
+        self,
+        platform_id: str,
+        username: str
+    ) -> ScanResultDetail:
+        """Scan single platform."""
+        if platform_id not in self.platforms:
+            return ScanResultDetail(
+                platform=platform_id,
+                platform_id=platform_id,
+                url="",
+                status=ScanStatus.ERROR.value,
+                error="Platform not configured",
+            )
+
+        platform = self.platforms[platform_id]
+        url = platform.url_prefix + username + platform.url_suffix
+        return await self._make_request(url, platform)
+
+    def _process_scan_results(
+        self,
+        valid_platforms: List[str],
+        results: List[ScanResultDetail]
+    ) -> tuple:
+        """Process scan results and return statistics in a single pass."""
+        found_count = 0
+        error_count = 0
+        rate_limited_count = 0
+        total_response_time = 0.0
+        platform_results = {}
+        errors = []
+        error_status = ScanStatus.ERROR.value
+        rate_limited_status = ScanStatus.RATE_LIMITED.value
+
+        for platform_id, result in zip(valid_platforms, results):
+            platform_results[platform_id] = result
+            total_response_time += result.response_time
+
+            if result.found:
+                found_count += 1
+            elif result.status == error_status:
+                error_count += 1
+                if result.error:
+                    errors.append(f"{result.platform}: {result.error}")
+            elif result.status == rate_limited_status:
+                rate_limited_count += 1
+
+        statistics = {
+            "total_platforms": len(valid_platforms),
+            "profiles_found": found_count,
+            "errors": error_count,
+            "rate_limited": rate_limited_count,
+            # Found results are never in the error state
+            "successful_requests": len(results) - error_count,
+            "average_response_time": (
+                total_response_time / len(results) if results else 0
+            ),
+            "total_requests": self.total_requests,
+        }
+
+        return found_count, platform_results, errors, statistics
+
+    async def iter_platform_results(
+        self,
+        username: str,
+        platform_ids: List[str]
+    ) -> AsyncIterator[Tuple[int, ScanResultDetail]]:
+        """Yield ``(index, result)`` per platform as soon as each scan finishes."""
+        pending: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(platform_ids):
+            pending.put_nowait(item)
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            # A fixed pool drains the queue; no per-platform task or semaphore
+            while True:
+                try:
+                    idx, platform_id = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    detail = await self.scan_platform(platform_id, username)
+                except (KeyError, ValueError) as err:
+                    logger.error(
+                        "Error scanning %s: %s",
+                        platform_id,
+                        str(err)
+                    )
+                    detail = ScanResultDetail(
+                        platform=self.platforms[platform_id].name,
+                        platform_id=platform_id,
+                        url="",
+                        status=ScanStatus.ERROR.value,
+                        error=str(err),
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    done.put_nowait((idx, err))  # Re-raised by the consumer
+                    return
+                done.put_nowait((idx, detail))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrent, len(platform_ids)))
+        ]
+        try:
+            for _ in platform_ids:
+                idx, detail = await done.get()
+                if isinstance(detail, Exception):
+                    raise detail
+                yield idx, detail
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def scan_username(
+        self,
+        username: str,
+        platforms: Optional[List[str]] = None
+    ) -> UsernameSearchResult:
+        """Scan username across multiple platforms."""
+        self.request_count = 0
+        clock = asyncio.get_running_loop().time
+        start_time = clock()
+
+        if not username or len(username.strip()) == 0:
+            return UsernameSearchResult(
+                username=username,
+                status="failed",
+                errors=["Invalid username provided"]
+            )
+
+        if platforms is None:
+            platforms = list(self.platforms.keys())
+
+        valid_platforms = [
+            p for p in platforms if p in self.platforms
+        ]
+
+        if not valid_platforms:
+            return UsernameSearchResult(
+                username=username,
+                status="failed",
+                errors=["No valid platforms specified"],
+            )
+
+        results: List[Optional[ScanResultDetail]] = [None] * len(valid_platforms)
+        async for idx, detail in self.iter_platform_results(username, valid_platforms):
+            results[idx] = detail
+
+        # Every slot is filled once the iterator is exhausted
+        found_count, platform_results, errors, statistics = (
+            self._process_scan_results(
+                valid_platforms, cast(List[ScanResultDetail], results)
+            )
+        )
+
+        scan_duration = clock() - start_time
+
+        result = UsernameSearchResult(
+            username=username,
+            total_platforms=len(valid_platforms),
+            profiles_found=found_count,
+            scan_duration=scan_duration,
+            status="completed",
+            platforms=platform_results,
+            errors=errors,
+            statistics=statistics,
+        )
+
+        logger.info(
+            "Scan completed for %s: %d profiles found in %.2fs",
+            username,
+            found_count,
+            scan_duration
+        )
+        return result
+
+    async def scan(self, username: str) -> UsernameSearchResult:
+        """Alias for scan_username."""
+        return await self.scan_username(username)
+
+    def get_platform_info(self) -> Dict[str, Any]:
+        """Get information about available platforms."""
+        return {
+            **self._platform_info_static,
+            "request_stats": {
+                "requests_this_session": self.request_count,
+                "total_requests": self.total_requests,
+            },
+        }
+
+    async def close(self) -> None:
+        """Close session and cleanup."""
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        if self.session and not self.session.closed:
+            await self.session.close()
+            logger.info("Session closed")
+
+    async def __aenter__(self) -> 'ProductionScanner':
+        """Async context manager entry."""
+        await self._ensure_session()
+        await self._prefetch_dns()
+        # Fire-and-forget: scans can start while the pool is still filling
+        self._warmup_task = asyncio.create_task(self._warm_connections())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+# ========================================================================
+# DEMO & TESTING
+# ========================================================================
+
+async def demo() -> None:
+    """Demo scanner functionality."""
+    print("\n" + "=" * 70)
+    print("HandyOsint Production Scanner - Demo")
+    print("=" * 70 + "\n")
+
+    async with ProductionScanner(max_concurrent=10) as scanner:
+        print("🔍 Testing single platform scan (GitHub)...")
+        result = await scanner.scan_platform("github", "torvalds")
+        print(f"   Status: {result.status}")
+        print(f"   Response Time: {result.response_time:.2f}s\n")
+
+        print("🔍 Testing multi-platform scan...")
+        platforms = ["github", "twitter", "reddit", "medium", "dev_to"]
+        scan_result = await scanner.scan_username("testuser123", platforms)
+
+        print(f"   Username: {scan_result.username}")
+        print(f"   Scan Duration: {scan_result.scan_duration:.2f}s")
+        print(
+            f"   Profiles Found: {scan_result.profiles_found}/"
+            f"{scan_result.total_platforms}"
+        )
+        print(f"   Status: {scan_result.status}\n")
+
+        print("   Platform Results:")
+        for detail in scan_result.platforms.values():
+            icon = "✓" if detail.found else "✗"
+            print(f"     {icon} {detail.platform}: {detail.status}")
+
+        print("\n📊 Available Platforms:")
+        info = scanner.get_platform_info()
+        for category, plat_list in info["categories"].items():
+            print(f"   {category}: {len(plat_list)} platforms")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
-        self._init_platforms()  # pylint: disable=E1101
+    asyncio.run(demo())
@@ -0,0 +1,32 @@
+"""
+JSON serialization helpers for HandyOsint, using orjson when it is installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode()
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` to a JSON string."""
+    return dumps_bytes(value).decode()
+
+
+def loads(raw: str) -> Any:
+    """Deserialize a JSON string."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -5,24 +5,34 @@ Complete OSINT Intelligence Platform with Professional Integration.
 
 This module provides:
 - Integrated UI system (banner, menu, terminal)
-- Database management with async support
 - Command center with comprehensive handlers
 - Error handling and logging
 - Signal management for graceful shutdown
 - Scan result correlation and analytics
 """
 import asyncio
-import json
+import atexit
+import copy
 import logging
+import os
+import queue
 import signal
-import sqlite3
 import sys
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+try:
+    import uvloop
+except ImportError:  # Optional event loop (not available on Windows)
+    uvloop = None
 
 # ========================================================================
 # PATH CONFIGURATION
@@ -40,7 +50,13 @@ sys.path.insert(0, str(BASE_DIR / "config"))
 try:
     from core.analysis import AdvancedAnalysisEngine
     from core.audit import AuditLogger
-    from core.integration import ExportFormat, IntegrationCoordinator, ScanPriority
+    from core.database import DatabaseManager
+    from core.integration import (
+        ExportFormat,
+        IntegrationCoordinator,
+        ScanPriority,
+        ScanTask,
+    )
     from core.models import AuditAction, AuditLogEntry, PlatformResult, ScanAnalysis
     from core.production_scanner import (  # Split into two lines
         ProductionScanner,
@@ -60,442 +76,48 @@ except ImportError as exc:
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(
-            LOG_DIR / f"handyosint_{datetime.now().strftime('%Y%m%d')}.log"
-        ),
-        logging.StreamHandler(),
-    ],
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+_log_handlers: List[logging.Handler] = [
+    logging.FileHandler(
+        LOG_DIR / f"handyosint_{datetime.now().strftime('%Y%m%d')}.log"
+    ),
+    logging.StreamHandler(),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+# Call sites only enqueue records; a listener thread does the blocking writes.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger("HandyOsint")
 
 
-# ========================================================================
-# DATABASE MANAGER
-# ========================================================================
-
-
-class DatabaseManager:
-    """SQLite database operations with async support."""
-
-    def __init__(self, db_path: Optional[Path] = None) -> None:
-        """Initialize database manager."""
-        self.db_path = db_path or BASE_DIR / "data" / "handyosint.db"
-        self.db_path.parent.mkdir(exist_ok=True)
-        self._init_database_sync()
-
-    def _init_database_sync(self) -> None:
-        """Initialize database schema synchronously."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Scan results table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS scan_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    target TEXT NOT NULL,
-                    platform TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    url TEXT,
-                    details TEXT,
-                    scan_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-
-            # Batch jobs table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS batch_jobs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    targets TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending',
-                    total_scans INTEGER,
-                    completed_scans INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP
-                )
-                """
-            )
-
-            # Create indexes
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_target ON scan_results(target)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_timestamp ON scan_results(timestamp)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_platform ON scan_results(platform)"
-            )
-
-            conn.commit()
-            conn.close()
-            logger.info("Database initialized: %s", self.db_path)
-
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Database initialization failed: %s", exc)
-            raise
-
-    async def _execute_db_operation(
-        self, func: Callable, *args: Any, **kwargs: Any
-    ) -> Any:
-        """Execute blocking DB operation in thread pool."""
-        return await asyncio.to_thread(func, *args, **kwargs)
-
-    async def save_result(
-        self,
-        target: str,
-        platform: str,
-        status: str,  # pylint: disable=too-many-arguments,too-many-positional-arguments
-        url: str = "",
-        scan_type: str = "",
-        details: Optional[Dict] = None,
-    ) -> bool:
-        """Save scan result asynchronously."""
-
-        def _save() -> bool:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT INTO scan_results
-                (timestamp, target, platform, status, url, details, scan_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    datetime.now().isoformat(),
-                    target,
-                    platform,
-                    status,
-                    url,
-                    json.dumps(details or {}),
-                    scan_type,
-                ),
-            )
-
-            conn.commit()
-            conn.close()
-            return True
-
-        try:
-            success = await self._execute_db_operation(_save)
-            logger.info("Saved result: %s on %s", target, platform)
-            return success
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Failed to save result: %s", exc)
-            return False
-
-    async def get_scan_history(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Retrieve scan history asynchronously."""
-
-        def _get_history() -> List[Dict[str, Any]]:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT id, timestamp, target, platform, status, url, scan_type
-                FROM scan_results
-                ORDER BY created_at DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(
-                    {
-                        "id": row[0],
-                        "timestamp": row[1],
-                        "target": row[2],
-                        "platform": row[3],
-                        "status": row[4],
-                        "url": row[5],
-                        "scan_type": row[6],
-                    }
-                )
-
-            conn.close()
-            return results
-
-        try:
-            return await self._execute_db_operation(_get_history)
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Failed to retrieve history: %s", exc)
-            return []
-
-    async def search_results(self, target: str) -> List[Dict[str, Any]]:
-        """Search results by target asynchronously."""
-
-        def _search() -> List[Dict[str, Any]]:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT id, timestamp, target, platform, status, url, scan_type
-                FROM scan_results
-                WHERE target LIKE ? OR url LIKE ?
-                ORDER BY created_at DESC
-                """,
-                (f"%{target}%", f"%{target}%"),
-            )
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(
-                    {
-                        "id": row[0],
-                        "timestamp": row[1],
-                        "target": row[2],
-                        "platform": row[3],
-                        "status": row[4],
-                        "url": row[5],
-                        "scan_type": row[6],
-                    }
-                )
-
-            conn.close()
-            return results
-
-        try:
-            return await self._execute_db_operation(_search)
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Search failed: %s", exc)
-            return []
-
-    async def get_statistics(self) -> Dict[str, Any]:
-        """Get database statistics asynchronously."""
-
-        def _get_stats() -> Dict[str, Any]:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM scan_results")
-            total_scans = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM scan_results WHERE status = 'FOUND'")
-            found_profiles = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(DISTINCT target) FROM scan_results")
-            unique_targets = cursor.fetchone()[0]
-
-            cursor.execute(
-                """
-                SELECT platform, COUNT(*) as count
-                FROM scan_results
-                GROUP BY platform
-                """
-            )
-            platforms = dict(cursor.fetchall())
-
-            conn.close()
-
-            return {
-                "total_scans": total_scans,
-                "found_profiles": found_profiles,
-                "unique_targets": unique_targets,
-                "platforms": platforms,
-            }
-
-        try:
-            return await self._execute_db_operation(_get_stats)
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Statistics retrieval failed: %s", exc)
-            return {}
-
-    async def get_correlated_target_profiles(self, target: str) -> Dict[str, Any]:
-        """Retrieve and correlate all scan results for target across platforms."""
-
-        def _get_profiles() -> Dict[str, Any]:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT platform, status, url, timestamp, created_at, details
-                FROM scan_results
-                WHERE target = ?
-                ORDER BY created_at DESC
-                """,
-                (target,),
-            )
-            raw_results = cursor.fetchall()
-
-            correlated_data: Dict[str, Any] = {
-                "target": target,
-                "profiles_by_platform": {},
-                "status_counts": {},
-                "history_summary": [],
-            }
-
-            for row in raw_results:
-                platform = row["platform"]
-                status = row["status"]
-
-                if platform not in correlated_data["profiles_by_platform"]:
-                    correlated_data["profiles_by_platform"][platform] = []
-
-                correlated_data["profiles_by_platform"][platform].append(
-                    {
-                        "status": status,
-                        "url": row["url"],
-                        "timestamp": row["timestamp"],
-                        "created_at": row["created_at"],
-                        "details": (
-                            json.loads(row["details"]) if row["details"] else None
-                        ),
-                    }
-                )
-
-                status_key = status.lower()
-                correlated_data["status_counts"][status_key] = (
-                    correlated_data["status_counts"].get(status_key, 0) + 1
-                )
-                correlated_data["history_summary"].append(
-                    f"{platform}: {status} on {row['created_at']}"
-                )
-
-            conn.close()
-            return correlated_data
-
-        try:
-            return await self._execute_db_operation(_get_profiles)
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Correlation query failed for target %s: %s", target, exc)
-            return {
-                "target": target,
-                "profiles_by_platform": {},
-                "status_counts": {},
-                "history_summary": [],
-                "error": str(exc),
-            }
-
-    async def get_overall_correlation_summary(
-        self, limit_targets: int = 10
-    ) -> Dict[str, Any]:
-        """Provide overall correlation summary across all scanned targets."""
-
-        def _get_summary() -> Dict[str, Any]:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            summary_data: Dict[str, Any] = {
-                "total_scans_recorded": 0,
-                "unique_targets_scanned": 0,
-                "top_targets_by_profiles_found": [],
-                "platforms_activity": {},
-                "status_distribution": {},
-                "recent_activity_overview": [],
-            }
-
-            cursor.execute("SELECT COUNT(*) FROM scan_results")
-            summary_data["total_scans_recorded"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(DISTINCT target) FROM scan_results")
-            summary_data["unique_targets_scanned"] = cursor.fetchone()[0]
-
-            cursor.execute(
-                """
-                SELECT target, COUNT(DISTINCT platform) as profiles_found_count
-                FROM scan_results
-                WHERE status = 'found'
-                GROUP BY target
-                ORDER BY profiles_found_count DESC, target ASC
-                LIMIT ?
-                """,
-                (limit_targets,),
-            )
-            summary_data["top_targets_by_profiles_found"] = [
-                dict(row) for row in cursor.fetchall()
-            ]
-
-            cursor.execute(
-                """
-                SELECT platform, status, COUNT(*) as count
-                FROM scan_results
-                GROUP BY platform, status
-                ORDER BY platform, status
-                """
-            )
-            platform_stats_raw = cursor.fetchall()
-
-            for row in platform_stats_raw:
-                platform = row["platform"]
-                status = row["status"].lower()
-                count = row["count"]
-
-                if platform not in summary_data["platforms_activity"]:
-                    summary_data["platforms_activity"][platform] = {
-                        "total": 0,
-                        "found": 0,
-                        "not_found": 0,
-                        "blocked": 0,
-                        "error": 0,
-                        "rate_limited": 0,
-                    }
-
-                summary_data["platforms_activity"][platform]["total"] += count
-                summary_data["platforms_activity"][platform][status] = (
-                    summary_data["platforms_activity"][platform].get(status, 0) + count
-                )
-
-            cursor.execute(
-                """
-                SELECT status, COUNT(*) as count
-                FROM scan_results
-                GROUP BY status
-                ORDER BY count DESC
-                """
-            )
-            summary_data["status_distribution"] = {
-                row["status"]: row["count"] for row in cursor.fetchall()
-            }
-
-            cursor.execute(
-                """
-                SELECT target, platform, status, created_at
-                FROM scan_results
-                ORDER BY created_at DESC
-                LIMIT 5
-                """
-            )
-            summary_data["recent_activity_overview"] = [
-                dict(row) for row in cursor.fetchall()
-            ]
-
-            conn.close()
-            return summary_data
-
-        try:
-            return await self._execute_db_operation(_get_summary)
-        except (sqlite3.Error, OSError) as exc:
-            logger.error("Overall correlation summary query failed: %s", exc)
-            return {"error": str(exc)}
-
-
 # ========================================================================
 # COMMAND CENTER
 # ========================================================================
 
+# Status cells are styled once here rather than markup-parsed for every row
+_STATUS_FOUND = Text("✓ Found", style="green")
+_STATUS_NOT_FOUND = Text("✗ Not Found", style="red")
+
 
 class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
     """Enterprise command center for OSINT operations."""
 
+    SEARCH_CACHE_TTL = 10.0  # Seconds a search page may answer narrower searches
+    SEARCH_PAGE_SIZE = 10
+    RECENT_TARGET_TTL = 3600  # Batch targets scanned this recently are skipped
+    RECENT_PROFILES_LIMIT = 100  # Targets whose correlation is kept in memory
+
     def __init__(self) -> None:
         """Initialize command center with all subsystems."""
         self.banner = Banner(BannerColorScheme.DARK_ORANGE)
@@ -507,102 +129,248 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         self.coordinator = IntegrationCoordinator()
         self.scanner = ProductionScanner()  # Initialize the actual scanner
         self.running = True
+        # Boot/shutdown animations are cosmetic delays; only play them in demos
+        self.demo_mode = os.environ.get("HANDYOSINT_DEMO", "0") not in ("", "0")
         self.worker_task: Optional[asyncio.Task] = None  # To hold the worker task
-
-        signal.signal(signal.SIGINT, self._handle_signal)
-        signal.signal(signal.SIGTERM, self._handle_signal)
+        self._shutdown_event = asyncio.Event()  # Set by signals to end run()
+        # Correlated profiles of recently viewed targets, kept current as this
+        # session scans them; the deque holds keys oldest-first for eviction.
+        self._recent: deque = deque()
+        self._recent_idx: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # (term, prefix, fetched_at, total, rows) of the last history search
+        self._search_cache: Tuple[str, bool, float, int, List[tuple]] = (
+            "",
+            False,
+            0.0,
+            0,
+            [],
+        )
 
         self._setup_menu()
 
+    def _setup_menu(self) -> None:
+        """Configure main menu items; the menu renders them once and reuses it."""
+        self.menu.add_item(
+            "1",
+            "Single Target Scan",
+            "Scan a single username across platforms",
+            icon="🔍",
+            action=self.handle_single_scan,
+        )
+        self.menu.add_item(
+            "2",
+            "Batch Scan",
+            "Scan multiple targets in sequence",
+            icon="📦",
+            action=self.handle_batch_scan,
+        )
+        self.menu.add_item(
+            "3",
+            "Search History",
+            "Query previous scan results",
+            icon="📚",
+            action=self.handle_search_history,
+        )
+        self.menu.add_item(
+            "4",
+            "View Statistics",
+            "Display scan statistics and insights",
+            icon="📊",
+            action=self.handle_statistics,
+        )
+        self.menu.add_item(
+            "5",
+            "Target Correlation",
+            "View correlated profiles for a target",
+            icon="🔗",
+            action=self.handle_target_correlation,
+        )
+        self.menu.add_item(
+            "6",
+            "Intelligence Summary",
+            "View overall intelligence summary",
+            icon="📈",
+            action=self.handle_intelligence_summary,
+        )
+        self.menu.add_item(
+            "7",
+            "Batch Jobs",
+            "View status of submitted batch jobs",
+            icon="🗂",
+            action=self.handle_view_batch_jobs,
+        )
+        self.menu.add_item(
+            "8",
+            "Scan Metrics",
+            "View aggregated scan metrics",
+            icon="📉",
+            action=self.handle_view_metrics,
+        )
+        self.menu.add_item(
+            "0",
+            "Exit",
+            "Gracefully shutdown the system",
+            icon="⏻",
+            action=self.handle_exit,
+        )
+
     async def _scan_worker_task(self) -> None:
-        """Asynchronous worker to process scan tasks from the queue."""
+        """Dispatch queued scan tasks, running up to the queue's worker limit."""
         logger.info("Scan worker task started.")
+        task_queue = self.coordinator.orchestrator.task_queue
+        slots = asyncio.Semaphore(task_queue.max_workers)
+        in_flight: Set[asyncio.Task] = set()
+
         async with self.scanner:  # Use async with for proper context management
-            while self.running:
-                try:
-                    task = await self.coordinator.orchestrator.task_queue.dequeue()
-                    if task:
-                        logger.info(
-                            "Worker dequeued task: %s for user %s",
-                            task.task_id,
-                            task.username,
-                        )
-                        task.metadata.status = "in_progress"
-                        task.metadata.started_at = datetime.now().isoformat()
-
-                        scan_result: UsernameSearchResult = (
-                            await self.scanner.scan_username(task.username)
-                        )
-
-                        # --- Data Transformation & Analysis ---
-                        scan_analysis = ScanAnalysis(
-                            username=scan_result.username,
-                            scan_id=task.task_id,  # Use task_id as scan_id for now
-                            timestamp=scan_result.timestamp,
-                            total_platforms=scan_result.total_platforms,
-                            profiles_found=scan_result.profiles_found,
-                            scan_duration=scan_result.scan_duration,
-                            errors=scan_result.errors,
-                            platforms={
-                                p_id: PlatformResult(
-                                    platform_id=p_id,
-                                    platform_name=p_detail.platform,
-                                    found=p_detail.found,
-                                    url=p_detail.url,
-                                    status=p_detail.status,
-                                    response_time=p_detail.response_time,
-                                    status_code=p_detail.status_code,
-                                )
-                                for p_id, p_detail in scan_result.platforms.items()
-                            },
-                        )
-
-                        # Perform analysis
-                        risk_score, risk_level = (
-                            self.analysis_engine.calculate_risk_score(scan_analysis)
-                        )
-                        scan_analysis.overall_risk_score = risk_score
-                        scan_analysis.risk_level = risk_level.label
-
-                        correlation_data = self.analysis_engine.analyze_correlations(
-                            scan_analysis
-                        )
-                        scan_analysis.correlation_data = correlation_data
-                        # --- End Data Transformation & Analysis ---
-
-                        # Save individual platform results to the database
-                        for platform_id, detail in scan_result.platforms.items():
-                            await self.db.save_result(
-                                target=scan_result.username,
-                                platform=platform_id,
-                                status=detail.status,
-                                url=detail.url,
-                                scan_type="batch",
-                                details=detail.to_dict(),
-                            )
-
-                        # Update Orchestrator with result (using the analyzed scan_analysis)
-                        self.coordinator.update_task_result(
-                            task.task_id,
-                            scan_analysis.to_dict(),  # Pass the full analyzed data # pylint: disable=no-member
-                            status="completed" if not scan_result.errors else "failed",
-                        )
-                        logger.info("Worker completed task: %s", task.task_id)
-                    else:
+            try:
+                while self.running:
+                    await slots.acquire()
+                    task = task_queue.dequeue()
+                    if task is None:
+                        slots.release()
                         await asyncio.sleep(0.5)  # Wait if queue is empty
-                except asyncio.CancelledError:
-                    logger.info("Scan worker task cancelled.")
-                    break
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.error("Error in scan worker task: %s", exc, exc_info=True)
-                    # Attempt to mark task as failed if an exception occurs
-                    if task:
-                        self.coordinator.update_task_result(
-                            task.task_id, {"error": str(exc)}, status="failed"
-                        )
-                    await asyncio.sleep(1)  # Prevent busy-loop on persistent errors
+                        continue
+
+                    logger.info(
+                        "Worker dequeued task: %s for user %s",
+                        task.task_id,
+                        task.username,
+                    )
+                    job = asyncio.create_task(self._process_scan_task(task))
+                    in_flight.add(job)
+                    job.add_done_callback(in_flight.discard)
+                    job.add_done_callback(lambda _: slots.release())
+            except asyncio.CancelledError:
+                logger.info("Scan worker task cancelled.")
+            finally:
+                for job in in_flight:
+                    job.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
         logger.info("Scan worker task stopped.")
 
+    async def _process_scan_task(self, task: ScanTask) -> None:
+        """Scan, analyze and persist a single dequeued task."""
+        try:
+            task.metadata.status = "in_progress"
+            task.metadata.started_at = datetime.now().isoformat()
+
+            scan_result: UsernameSearchResult = (
+                await self.scanner.scan_username(task.username)
+            )
+
+            # --- Data Transformation & Analysis ---
+            scan_analysis = ScanAnalysis(
+                username=scan_result.username,
+                scan_id=task.task_id,  # Use task_id as scan_id for now
+                timestamp=scan_result.timestamp,
+                total_platforms=scan_result.total_platforms,
+                profiles_found=scan_result.profiles_found,
+                scan_duration=scan_result.scan_duration,
+                errors=scan_result.errors,
+                platforms={
+                    p_id: PlatformResult(
+                        platform_id=p_id,
+                        platform_name=p_detail.platform,
+                        found=p_detail.found,
+                        url=p_detail.url,
+                        status=p_detail.status,
+                        response_time=p_detail.response_time,
+                        status_code=p_detail.status_code,
+                    )
+                    for p_id, p_detail in scan_result.platforms.items()
+                },
+            )
+
+            # Perform analysis
+            risk_score, risk_level = (
+                self.analysis_engine.calculate_risk_score(scan_analysis)
+            )
+            scan_analysis.overall_risk_score = risk_score
+            scan_analysis.risk_level = risk_level.label
+
+            correlation_data = self.analysis_engine.analyze_correlations(
+                scan_analysis
+            )
+            scan_analysis.correlation_data = correlation_data
+            # --- End Data Transformation & Analysis ---
+
+            # Save all platform results in one transaction
+            rows = [
+                (
+                    scan_result.username,
+                    platform_id,
+                    detail.status,
+                    detail.url,
+                    "batch",
+                    detail.to_dict(),
+                )
+                for platform_id, detail in scan_result.platforms.items()
+            ]
+            if await self.db.save_results_bulk(rows):
+                # Only rows that reached the database belong in the memo
+                self._remember_results(scan_result.username, rows)
+
+            # Update Orchestrator with result (using the analyzed scan_analysis)
+            self.coordinator.update_task_result(
+                task.task_id,
+                scan_analysis.to_dict(),  # Pass the full analyzed data # pylint: disable=no-member
+                status="completed" if not scan_result.errors else "failed",
+            )
+            logger.info("Worker completed task: %s", task.task_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Error in scan worker task: %s", exc, exc_info=True)
+            self.coordinator.update_task_result(
+                task.task_id, {"error": str(exc)}, status="failed"
+            )
+
+    def _remember_profiles(self, target: str, correlated: Dict[str, Any]) -> None:
+        """Keep a target's full correlation in memory, evicting the oldest."""
+        if target not in self._recent_idx:
+            self._recent.append(target)
+            if len(self._recent) > self.RECENT_PROFILES_LIMIT:
+                self._recent_idx.pop(self._recent.popleft(), None)
+        # A private copy: the DB read cache may hand the same dict out again
+        self._recent_idx[target] = (time.monotonic(), copy.deepcopy(correlated))
+
+    def _recalled_profiles(self, target: str) -> Optional[Dict[str, Any]]:
+        """Return a remembered correlation younger than RECENT_TARGET_TTL."""
+        entry = self._recent_idx.get(target)
+        if entry is None:
+            return None
+        loaded_at, correlated = entry
+        if time.monotonic() - loaded_at > self.RECENT_TARGET_TTL:
+            del self._recent_idx[target]
+            self._recent.remove(target)
+            return None
+        return correlated
+
+    def _remember_results(self, target: str, rows: List[tuple]) -> None:
+        """Prepend freshly saved rows to a remembered target's correlation."""
+        correlated = self._recalled_profiles(target)
+        if correlated is None:
+            return  # Not loaded yet; the next lookup reads the full history
+
+        timestamp = datetime.now().isoformat(timespec="milliseconds")
+        created_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        profiles = correlated["profiles_by_platform"]
+        status_counts = correlated["status_counts"]
+        history = [f"{row[1]}: {row[2]} on {created_at}" for row in rows]
+
+        for _, platform, status, url, _, details in rows:
+            profiles.setdefault(platform, []).insert(
+                0,
+                {
+                    "status": status,
+                    "url": url,
+                    "timestamp": timestamp,
+                    "created_at": created_at,
+                    "details": details or {},
+                },
+            )
+            key = status.lower()
+            status_counts[key] = status_counts.get(key, 0) + 1
+        correlated["history_summary"][:0] = history
+
     async def _start_worker(self) -> None:
         """Start the background worker task."""
         if self.worker_task is None or self.worker_task.done():
@@ -616,12 +384,31 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
             await self.worker_task
             logger.info("Background scan worker task stopped.")
 
+    def _install_signal_handlers(self) -> None:
+        """Route SIGINT/SIGTERM through the running event loop."""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._handle_signal, signum)
+            except NotImplementedError:  # Windows event loops
+                signal.signal(signum, self._handle_signal)
+
+    def _remove_signal_handlers(self) -> None:
+        """Undo _install_signal_handlers."""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(signum)
+            except NotImplementedError:
+                signal.signal(signum, signal.SIG_DFL)
+
     def _handle_signal(
         self, signum: int, frame: Optional[Any] = None
     ) -> None:  # pylint: disable=unused-argument
-        """Handle interrupt signals. Frame argument required by signal handler."""
+        """Handle interrupt signals. Frame is only passed by signal.signal."""
         logger.info("Received signal: %s", signum)
         self.running = False
+        self._shutdown_event.set()
         # The worker will be gracefully stopped in run() and main()
 
     def _display_scan_results(self, scan_analysis: ScanAnalysis):
@@ -656,9 +443,7 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         for result in sorted(
             scan_analysis.platforms.values(), key=lambda r: r.platform_name
         ):
-            status = (
-                "[green]✓ Found[/green]" if result.found else "[red]✗ Not Found[/red]"
-            )
+            status = _STATUS_FOUND if result.found else _STATUS_NOT_FOUND
             results_table.add_row(result.platform_name, status, result.url)
 
         self.terminal.console.print(results_table)
@@ -666,18 +451,21 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         # Correlation Panel
         correlation_data = scan_analysis.correlation_data
         if correlation_data:
-            corr_content = ""
+            parts: List[str] = []
             if correlation_data.common_patterns:
-                corr_content += "[bold]Common Patterns:[/bold]\n"
-                corr_content += "\n".join(
-                    f"- {p}" for p in correlation_data.common_patterns
+                parts.append("[bold]Common Patterns:[/bold]\n")
+                parts.append(
+                    "\n".join(f"- {p}" for p in correlation_data.common_patterns)
                 )
-                corr_content += "\n\n"
+                parts.append("\n\n")
             if correlation_data.likely_connections:
-                corr_content += "[bold]Likely Connections:[/bold]\n"
-                for p, conns in correlation_data.likely_connections.items():
-                    if conns:
-                        corr_content += f"- {p} -> {', '.join(conns)}\n"
+                parts.append("[bold]Likely Connections:[/bold]\n")
+                parts.extend(
+                    f"- {p} -> {', '.join(conns)}\n"
+                    for p, conns in correlation_data.likely_connections.items()
+                    if conns
+                )
+            corr_content = "".join(parts)
 
             if corr_content:
                 correlation_panel = Panel(
@@ -741,7 +529,23 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
             self.menu.display_warning("Operation cancelled")
             return
 
-        usernames = [t.strip() for t in targets_input.split(",")]
+        # Drop blanks and repeats, then anything already scanned recently
+        submitted = list(
+            dict.fromkeys(filter(None, (t.strip() for t in targets_input.split(","))))
+        )
+        recent = await self.db.get_recent_targets(
+            submitted, ttl=self.RECENT_TARGET_TTL
+        )
+        usernames = [t for t in submitted if t not in recent]
+
+        if not usernames:
+            self.menu.display_warning(
+                f"All {len(submitted)} targets were scanned recently"
+                if submitted
+                else "No valid targets entered"
+            )
+            self.menu.prompt_selection("PRESS ENTER TO CONTINUE")
+            return
 
         # Prompt for export formats
         export_choices = {
@@ -794,8 +598,8 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         # The orchestration is handled internally by IntegrationCoordinator,
         # so we just need to confirm the job creation.
         self.menu.display_success(
-            f"Batch scan job '{job.job_id}' created for {len(usernames)} targets. "
-            f"Status: {job.status}"
+            f"Batch scan job '{job.job_id}' created for {len(usernames)} of "
+            f"{len(submitted)} submitted targets. Status: {job.status}"
         )
         self.menu.prompt_selection("PRESS ENTER TO CONTINUE")
 
@@ -805,28 +609,63 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         self.banner.display("results", animate=False)
         self.menu.display_info("SEARCH SCAN HISTORY")
 
-        search_term = self.menu.prompt_input("ENTER SEARCH TERM")
+        search_term = self.menu.prompt_input(
+            "ENTER SEARCH TERM (term* to match targets starting with term)"
+        )
 
-        if not search_term:
+        if not search_term.rstrip("*"):
             self.menu.display_warning("Operation cancelled")
             return
 
         self.menu.display_processing("Searching database...")
-        results = await self.db.search_results(search_term)
+        total, results = await self._search_history(search_term)
 
         if results:
             headers = ["ID", "Target", "Platform", "Status", "URL"]
-            rows = [
-                [str(r["id"]), r["target"], r["platform"], r["status"], r["url"][:40]]
-                for r in results[:10]
-            ]
+            rows = ((str(i), t, p, s, u[:40]) for i, t, p, s, u in results)
             self.menu.display_table(headers, rows, title="Search Results")
-            self.menu.display_info(f"Found {len(results)} results")
+            self.menu.display_info(f"Found {total} results")
         else:
             self.menu.display_warning(f"No results found for: {search_term}")
 
         self.menu.prompt_selection("PRESS ENTER TO CONTINUE")
 
+    async def _search_history(self, term: str) -> Tuple[int, List[tuple]]:
+        """Search history, narrowing the previous result in memory when possible.
+
+        A term is searched for anywhere in targets and URLs; a term ending in
+        "*" is an indexed prefix search on the target instead. A narrower term
+        in the same mode matches a subset of the previous rows, so if the
+        previous page held every match it can be filtered locally.
+        """
+        prefix = term.endswith("*")
+        needle = term.rstrip("*").lower()
+        cached_needle, cached_mode, fetched_at, cached_total, cached_rows = (
+            self._search_cache
+        )
+        if (
+            cached_needle
+            and cached_mode == prefix
+            and cached_total <= len(cached_rows)
+            and time.monotonic() - fetched_at < self.SEARCH_CACHE_TTL
+        ):
+            if prefix and needle.startswith(cached_needle):
+                rows = [row for row in cached_rows if row[1].lower().startswith(needle)]
+                return len(rows), rows
+            if not prefix and cached_needle in needle:
+                rows = [
+                    row
+                    for row in cached_rows
+                    if needle in row[1].lower() or needle in row[4].lower()
+                ]
+                return len(rows), rows
+
+        total, rows = await self.db.search_results_page(
+            term.rstrip("*"), limit=self.SEARCH_PAGE_SIZE, prefix=prefix
+        )
+        self._search_cache = (needle, prefix, time.monotonic(), total, rows)
+        return total, rows
+
     async def handle_statistics(self) -> None:
         """Handle statistics display."""
         self.terminal.clear()
@@ -836,18 +675,20 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         stats = await self.db.get_statistics()
 
         if stats:
-            content = (
+            platforms = stats.get("platforms") or {}
+            parts = [
                 f"\nTotal Scans: {stats.get('total_scans', 0)}\n"
                 f"Found Profiles: {stats.get('found_profiles', 0)}\n"
                 f"Unique Targets: {stats.get('unique_targets', 0)}\n"
-                f"Platforms Scanned: {len(stats.get('platforms', {}))}\n"
+                f"Platforms Scanned: {len(platforms)}\n"
                 "\nPlatform Breakdown:"
+            ]
+            parts.extend(
+                f"\n  {platform}: {count} scans"
+                for platform, count in platforms.items()
             )
 
-            for platform, count in stats.get("platforms", {}).items():
-                content += f"\n  {platform}: {count} scans"
-
-            self.menu.display_panel("Statistics", content)
+            self.menu.display_panel("Statistics", "".join(parts))
         else:
             self.menu.display_warning("No statistics available")
 
@@ -865,22 +706,30 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
             self.menu.display_warning("Operation cancelled")
             return
 
-        self.menu.display_processing("Correlating profiles...")
-        correlated = await self.db.get_correlated_target_profiles(target)
+        correlated = self._recalled_profiles(target)
+        if correlated is None:
+            self.menu.display_processing("Correlating profiles...")
+            correlated = await self.db.get_correlated_target_profiles(target)
+            if "error" not in correlated:
+                self._remember_profiles(target, correlated)
 
         if correlated.get("profiles_by_platform"):
-            content = f"\nTarget: {correlated['target']}\n"
-            content += f"Profiles Found: {len(correlated['profiles_by_platform'])}\n"
-            content += "\nStatus Summary:\n"
-
-            for status, count in correlated.get("status_counts", {}).items():
-                content += f"  {status}: {count}\n"
+            parts = [
+                f"\nTarget: {correlated['target']}\n",
+                f"Profiles Found: {len(correlated['profiles_by_platform'])}\n",
+                "\nStatus Summary:\n",
+            ]
+            parts.extend(
+                f"  {status}: {count}\n"
+                for status, count in correlated.get("status_counts", {}).items()
+            )
 
-            content += "\nRecent Activity:\n"
-            for entry in correlated.get("history_summary", [])[:5]:
-                content += f"  {entry}\n"
+            parts.append("\nRecent Activity:\n")
+            parts.extend(
+                f"  {entry}\n" for entry in correlated.get("history_summary", [])[:5]
+            )
 
-            self.menu.display_panel("Target Correlation", content)
+            self.menu.display_panel("Target Correlation", "".join(parts))
         else:
             self.menu.display_warning(f"No profiles found for: {target}")
 
@@ -895,24 +744,27 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
         summary = await self.db.get_overall_correlation_summary()
 
         if summary and "error" not in summary:
-            content = (
+            parts = [
                 f"\nTotal Scans: {summary.get('total_scans_recorded', 0)}\n"
                 f"Unique Targets: {summary.get('unique_targets_scanned', 0)}\n"
                 f"\nTop Targets by Profiles:\n"
+            ]
+            # Rows come straight from _SQL_TOP_TARGETS, so both keys are present
+            top_targets = summary.get("top_targets_by_profiles_found") or []
+            parts.extend(
+                f"  {row['target']}: {row['profiles_found_count']} profiles\n"
+                for row in top_targets[:5]
             )
 
-            for target_info in summary.get("top_targets_by_profiles_found", [])[:5]:
-                content += (
-                    f"  {target_info.get('target', 'Unknown')}: "
-                    f"{target_info.get('profiles_found_count', 0)} "
-                    "profiles\n"
-                )
-
-            content += "\nPlatform Activity:\n"
-            for platform, stats in summary.get("platforms_activity", {}).items():
-                content += f"  {platform}: {stats.get('total', 0)} scans\n"
+            parts.append("\nPlatform Activity:\n")
+            # Every platforms_activity entry is created with a "total" counter
+            activity = summary.get("platforms_activity") or {}
+            parts.extend(
+                f"  {platform}: {counts['total']} scans\n"
+                for platform, counts in activity.items()
+            )
 
-            self.menu.display_panel("Intelligence Summary", content)
+            self.menu.display_panel("Intelligence Summary", "".join(parts))
         else:
             self.menu.display_warning("Unable to retrieve summary")
 
@@ -937,21 +789,38 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
     async def handle_exit(self) -> None:
         """Handle graceful exit."""
         if self.menu.prompt_confirm("Shutdown system?"):
-            self.terminal.shutdown_sequence()
+            self.terminal.shutdown_sequence(animate=self.demo_mode)
             self.running = False
 
+    async def _prompt_unless_shutdown(self, message: str) -> Optional[str]:
+        """Wait for a menu selection, or return None as soon as shutdown is set."""
+        prompt = asyncio.create_task(self.menu.prompt_selection_async(message))
+        shutdown = asyncio.create_task(self._shutdown_event.wait())
+        done, pending = await asyncio.wait(
+            {prompt, shutdown}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        if prompt in done:
+            return prompt.result()
+        return None
+
     async def run(self) -> None:
         """Main command center loop."""
         self.terminal.clear()
-        self.terminal.boot_sequence()
-        self.banner.display("main", animate=True)
+        self.terminal.boot_sequence(animate=self.demo_mode)
+        self.banner.display("main", animate=self.demo_mode)
 
+        self._install_signal_handlers()
+        await self.db.connect()
         await self._start_worker()  # Start the background worker task
 
         while self.running:
             try:
                 self.menu.display()
-                selection = self.menu.prompt_selection("SELECT OPERATION")
+                selection = await self._prompt_unless_shutdown("SELECT OPERATION")
+                if selection is None:
+                    break
 
                 if selection == "0":
                     await self.handle_exit()
@@ -960,15 +829,13 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
                     if item and item.action:
                         await item.action()
 
-            except KeyboardInterrupt:
-                self.menu.display_warning("Operation interrupted")
-                if not self.menu.prompt_confirm("Continue?"):
-                    await self.handle_exit()
             except (OSError, asyncio.TimeoutError) as exc:
                 logger.error("Command execution error: %s", exc)
                 self.menu.display_error(f"Error: {str(exc)}")
 
         await self._stop_worker()  # Stop the background worker task
+        self.db.close()
+        self._remove_signal_handlers()
 
 
 # ========================================================================
@@ -978,6 +845,7 @@ class CommandCenter:  # pylint: disable=too-many-instance-attributes,no-member
 
 async def main() -> None:
     """Main application entry point."""
+    command_center = None
     try:
         command_center = CommandCenter()
         await command_center.run()
@@ -985,11 +853,19 @@ async def main() -> None:
         logger.error("Fatal error: %s", exc)
         print(f"\n\033[91m[FATAL ERROR] {exc}\033[0m")
         sys.exit(1)
+    finally:
+        # The audit writer is a daemon thread: commit its queue on every exit path
+        if command_center is not None:
+            command_center.audit_logger.close()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n\033[93m[SYSTEM] Interrupted by user\033[0m")
         sys.exit(0)
@@ -0,0 +1,137 @@
+# pylint: disable=redefined-outer-name, protected-access
+"""
+Pytest unit tests for the HandyOsint AppConfig singleton.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from config.app_config import AppConfig
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Project root with a minimal config/config.yaml."""
+    (tmp_path / "config").mkdir()
+    with open(tmp_path / "config" / "config.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(
+            {
+                "scanner": {"max_concurrent_requests": 5},
+                "database": {"path": "data/test.db"},
+            },
+            f,
+        )
+    return tmp_path
+
+
+@pytest.fixture
+def app_config(base_dir):
+    """Fresh AppConfig bound to the temporary project root."""
+    AppConfig._instance = None
+    config = AppConfig(base_dir)
+    yield config
+    AppConfig._instance = None
+
+
+def test_get_reads_yaml_and_merges_defaults(app_config):
+    """Values from config.yaml override defaults; missing sections fall back."""
+    assert app_config.get("scanner.max_concurrent_requests") == 5
+    assert app_config.get("logging.level") == "INFO"
+    assert app_config.get("missing.key", "fallback") == "fallback"
+    assert app_config.get("scanner") == {"max_concurrent_requests": 5}
+
+
+def test_get_resolves_paths_against_base_dir(app_config, base_dir):
+    """Path-valued keys are returned relative to the project root."""
+    assert app_config.get("database.path") == base_dir / Path("data/test.db")
+
+
+def test_set_invalidates_get_cache(app_config):
+    """A set() is visible to the next get() of the same key."""
+    assert app_config.get("scanner.request_timeout") is None
+    app_config.set("scanner.request_timeout", 60)
+    assert app_config.get("scanner.request_timeout") == 60
+
+
+def test_json_sidecar_written_and_reused(app_config, base_dir):
+    """The parsed YAML is cached next to the file and reused on reload."""
+    cache_path = base_dir / "config" / "config.yaml.json"
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == {
+        "scanner": {"max_concurrent_requests": 5},
+        "database": {"path": "data/test.db"},
+    }
+
+    AppConfig._instance = None
+    with patch.object(yaml, "load", side_effect=AssertionError("YAML re-parsed")):
+        reloaded = AppConfig(base_dir)
+    assert reloaded.get("scanner.max_concurrent_requests") == 5
+
+
+def test_warm_start_applies_current_defaults(app_config, base_dir, monkeypatch):
+    """Defaults are merged after the sidecar loads, so new defaults show up."""
+    assert app_config.get("ui") is not None
+    defaults = app_config._get_default_config()
+    defaults["telemetry"] = {"enabled": False}
+    monkeypatch.setattr(AppConfig, "_get_default_config", lambda self: defaults)
+
+    AppConfig._instance = None
+    reloaded = AppConfig(base_dir)
+    assert reloaded.get("telemetry.enabled") is False
+    assert reloaded.get("scanner.max_concurrent_requests") == 5
+
+
+def test_reload_only_reparses_when_file_changes(app_config, base_dir, monkeypatch):
+    """reload() is a no-op until the YAML mtime moves; force=True always reads."""
+    calls = []
+    original = AppConfig._read_config
+    monkeypatch.setattr(
+        AppConfig, "_read_config", lambda self: calls.append(1) or original(self)
+    )
+
+    app_config.reload()
+    assert not calls
+
+    config_path = base_dir / "config" / "config.yaml"
+    with open(config_path, "w", encoding="utf-8") as f:
+        yaml.safe_dump({"scanner": {"max_concurrent_requests": 7}}, f)
+    stat = config_path.stat()
+    os.utime(config_path, (stat.st_atime, app_config._mtime + 10))
+
+    app_config.reload()
+    assert calls == [1]
+    assert app_config.get("scanner.max_concurrent_requests") == 7
+
+    app_config.reload(force=True)
+    assert calls == [1, 1]
+
+
+def test_concurrent_first_use_loads_once(base_dir, monkeypatch):
+    """Threads racing to create the singleton share one instance and one parse."""
+    calls = []
+    original = AppConfig._read_config
+    monkeypatch.setattr(
+        AppConfig, "_read_config", lambda self: calls.append(1) or original(self)
+    )
+    AppConfig._instance = None
+    barrier = threading.Barrier(8)
+    instances = []
+
+    def create():
+        barrier.wait()
+        instances.append(AppConfig(base_dir))
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    AppConfig._instance = None
+
+    assert calls == [1]
+    assert len({id(instance) for instance in instances}) == 1
@@ -0,0 +1,79 @@
+"""
+Pytest unit tests for the queued AuditLogger.
+"""
+
+import pytest
+
+pytest.importorskip("pydantic")  # core.models
+
+# pylint: disable=wrong-import-position
+from core.audit import AuditLogger
+from core.models import AuditLogEntry
+
+
+def _entry(scan_id, timestamp="2025-01-01T00:00:00"):
+    return AuditLogEntry(
+        timestamp=timestamp,
+        action="scan",
+        username="alice",
+        scan_id=scan_id,
+        details={"platforms": 3},
+    )
+
+
+def test_history_includes_entries_still_queued(tmp_path):
+    """A log() followed straight away by a read sees the new entry."""
+    audit = AuditLogger(db_path=str(tmp_path / "audit.db"))
+    try:
+        audit.log(_entry("scan-1"))
+        history = audit.get_scan_history("alice")
+        assert [row["scan_id"] for row in history] == ["scan-1"]
+    finally:
+        audit.close()
+
+
+def test_close_commits_queued_entries(tmp_path):
+    """Entries queued before close() are written and readable afterwards."""
+    db_path = str(tmp_path / "audit.db")
+    audit = AuditLogger(db_path=db_path)
+    for i in range(10):
+        audit.log(_entry(f"scan-{i}", timestamp=f"2025-01-01T00:00:{i:02d}"))
+    audit.close()
+
+    reopened = AuditLogger(db_path=db_path)
+    try:
+        history = reopened.get_scan_history("alice", limit=3)
+        assert [row["scan_id"] for row in history] == ["scan-9", "scan-8", "scan-7"]
+    finally:
+        reopened.close()
+
+
+def test_log_after_close_writes_directly(tmp_path):
+    """With the writer stopped, log() still persists the entry."""
+    db_path = str(tmp_path / "audit.db")
+    audit = AuditLogger(db_path=db_path)
+    audit.close()
+    audit.log(_entry("scan-late"))
+
+    reopened = AuditLogger(db_path=db_path)
+    try:
+        history = reopened.get_scan_history("alice")
+        assert [row["scan_id"] for row in history] == ["scan-late"]
+    finally:
+        reopened.close()
+
+
+def test_writer_survives_a_failing_batch(tmp_path, monkeypatch):
+    """An unexpected error in one batch does not stop the writer thread."""
+    audit = AuditLogger(db_path=str(tmp_path / "audit.db"))
+    try:
+        monkeypatch.setattr("core.audit._SQL_INSERT_AUDIT", None)  # TypeError
+        audit.log(_entry("scan-lost"))
+        audit.flush()
+        monkeypatch.undo()
+
+        audit.log(_entry("scan-kept"))
+        history = audit.get_scan_history("alice")
+        assert [row["scan_id"] for row in history] == ["scan-kept"]
+    finally:
+        audit.close()
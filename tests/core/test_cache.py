@@ -0,0 +1,51 @@
+"""
+Pytest unit tests for the CacheManager TTL cache.
+"""
+
+from core import cache as cache_module
+from core.cache import CacheManager
+
+
+def _fake_clock(monkeypatch, start=1000.0):
+    """Drive time.monotonic() from a mutable list."""
+    now = [start]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_until_ttl_elapses(monkeypatch):
+    """Entries are served until their TTL passes, then dropped on read."""
+    now = _fake_clock(monkeypatch)
+    cache = CacheManager(ttl_seconds=10)
+    cache.set("a", 1)
+    now[0] += 10
+    assert cache.get("a") == 1
+    now[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.get("missing") is None
+
+
+def test_cleanup_expired_skips_refreshed_keys(monkeypatch):
+    """A key re-set after its first heap entry expires is not evicted."""
+    now = _fake_clock(monkeypatch)
+    cache = CacheManager(ttl_seconds=5)
+    cache.set("old", 1)
+    cache.set("refreshed", 2)
+    now[0] += 3
+    cache.set("refreshed", 3)
+    now[0] += 3
+
+    assert cache.cleanup_expired() == 1
+    assert cache.get("old") is None
+    assert cache.get("refreshed") == 3
+
+
+def test_heap_is_compacted_for_hot_keys(monkeypatch):
+    """Repeatedly setting one key does not grow the expiry heap without bound."""
+    now = _fake_clock(monkeypatch)
+    cache = CacheManager(ttl_seconds=5)
+    for i in range(500):
+        now[0] += 0.01
+        cache.set("hot", i)
+    assert len(cache._expiry_heap) <= 2 + 64  # pylint: disable=protected-access
+    assert cache.get("hot") == 499
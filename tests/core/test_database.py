@@ -0,0 +1,144 @@
+# pylint: disable=redefined-outer-name
+"""
+Pytest unit tests for the batched DatabaseManager.
+"""
+
+import sqlite3
+
+import pytest
+
+from core.database import DatabaseManager
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseManager on a fresh file, closed after the test."""
+    manager = DatabaseManager(db_path=tmp_path / "handyosint.db")
+    yield manager
+    manager.close()
+
+
+async def _seed(db):
+    await db.save_results_bulk(
+        [
+            ("alice", "GitHub", "found", "https://github.com/alice", "single", None),
+            ("malice", "Reddit", "found", "https://reddit.com/user/malice", "", None),
+            ("bob", "GitLab", "not_found", "https://gitlab.com/alice-fan", "", None),
+        ]
+    )
+
+
+async def test_search_page_defaults_to_substring(db):
+    """A plain term matches anywhere in targets and URLs."""
+    await _seed(db)
+    total, rows = await db.search_results_page("alice")
+    assert total == 3
+    assert {row[1] for row in rows} == {"alice", "malice", "bob"}
+
+
+async def test_search_page_prefix_is_opt_in(db):
+    """prefix=True only matches targets starting with the term."""
+    await _seed(db)
+    total, rows = await db.search_results_page("ALI", prefix=True)
+    assert total == 1
+    assert rows[0][1:3] == ("alice", "GitHub")
+
+
+async def test_search_page_escapes_like_wildcards(db):
+    """% and _ in the term match literally."""
+    await _seed(db)
+    assert await db.search_results_page("a_ice") == (0, [])
+    assert await db.search_results_page("%", prefix=True) == (0, [])
+
+
+async def test_recent_targets_only_reports_submitted_names(db, monkeypatch):
+    """Only the asked-about targets come back, across query chunks."""
+    await _seed(db)
+    monkeypatch.setattr("core.database._RECENT_TARGETS_CHUNK", 2)
+    recent = await db.get_recent_targets(["bob", "carol", "alice"], ttl=3600)
+    assert recent == {"alice", "bob"}
+    assert await db.get_recent_targets([]) == set()
+
+
+def _row_count(db):
+    """Count committed rows through a separate connection."""
+    conn = sqlite3.connect(db.db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM scan_results").fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def test_save_result_is_queued_until_a_read_flushes(db):
+    """Single saves are batched; any getter writes the queue before reading."""
+    assert await db.save_result(
+        "alice", "GitHub", "found", "https://github.com/alice", "single", {"id": 1}
+    )
+    assert _row_count(db) == 0
+
+    history = await db.get_scan_history()
+    assert _row_count(db) == 1
+    assert [(r["target"], r["platform"], r["status"]) for r in history] == [
+        ("alice", "GitHub", "found")
+    ]
+    assert (await db.search_results("github.com"))[0]["scan_type"] == "single"
+
+
+async def test_full_batch_flushes_without_waiting(db, monkeypatch):
+    """Reaching FLUSH_BATCH_SIZE writes the batch straight away."""
+    monkeypatch.setattr(DatabaseManager, "FLUSH_BATCH_SIZE", 3)
+    for platform in ("GitHub", "GitLab"):
+        await db.save_result("alice", platform, "found")
+    assert _row_count(db) == 0
+    await db.save_result("alice", "Reddit", "not_found")
+    assert _row_count(db) == 3
+
+
+async def test_bulk_rows_read_back_through_every_getter(db):
+    """Rows from save_results_bulk are visible to each aggregate getter."""
+    await _seed(db)
+
+    stats = await db.get_statistics()
+    assert stats["total_scans"] == 3
+    assert stats["unique_targets"] == 3
+    assert stats["platforms"] == {"GitHub": 1, "Reddit": 1, "GitLab": 1}
+
+    profiles = await db.get_correlated_target_profiles("alice")
+    assert profiles["status_counts"] == {"found": 1}
+    assert profiles["profiles_by_platform"]["GitHub"][0]["details"] == {}
+
+    summary = await db.get_overall_correlation_summary()
+    assert summary["total_scans_recorded"] == 3
+    assert summary["status_distribution"] == {"found": 2, "not_found": 1}
+    assert {t["target"] for t in summary["top_targets_by_profiles_found"]} == {
+        "alice",
+        "malice",
+    }
+
+
+async def test_flush_clears_read_cache(db):
+    """Cached aggregates are dropped once new rows are written."""
+    await _seed(db)
+    assert (await db.get_statistics())["total_scans"] == 3
+    await db.get_correlated_target_profiles("alice")
+    cache = db._read_cache  # pylint: disable=protected-access
+    assert cache.get("statistics") is not None
+
+    await db.save_result("alice", "Twitch", "found")
+    await db.flush()
+    assert cache.get("statistics") is None
+    assert cache.get("profiles:alice") is None
+
+    assert (await db.get_statistics())["total_scans"] == 4
+    profiles = await db.get_correlated_target_profiles("alice")
+    assert set(profiles["profiles_by_platform"]) == {"GitHub", "Twitch"}
+
+
+async def test_close_writes_queued_rows(tmp_path):
+    """close() commits results that were still waiting for a flush."""
+    manager = DatabaseManager(db_path=tmp_path / "handyosint.db")
+    await manager.save_result("alice", "GitHub", "found")
+    manager.close()
+    assert _row_count(manager) == 1
@@ -0,0 +1,46 @@
+"""
+Pytest unit tests for the README section parser.
+"""
+
+from core.documentation import IntegratedDocumentation
+
+README = """# HandyOsint
+
+## About HandyOsint
+Intro line
+### Details
+More about
+
+## Usage
+Run it
+
+## Changelog
+Not a known section
+"""
+
+
+def _write_readme(tmp_path, content=README):
+    readme = tmp_path / "README.md"
+    readme.write_text(content, encoding="utf-8")
+    return readme
+
+
+def test_sections_are_split_on_level_two_headings(tmp_path):
+    """Known headings are matched by prefix; unknown ones end the open section."""
+    docs = IntegratedDocumentation(_write_readme(tmp_path))
+    assert docs.sections["about"] == "Intro line\n### Details\nMore about\n"
+    assert docs.sections["usage"] == "Run it\n"
+    assert docs.sections["license"] is None
+
+
+def test_sections_are_reused_from_sidecar(tmp_path, monkeypatch):
+    """A second load reads the JSON sidecar instead of re-parsing README.md."""
+    readme = _write_readme(tmp_path)
+    first = IntegratedDocumentation(readme).sections
+    assert (tmp_path / "README.sections.json").exists()
+
+    def _fail(*_args):
+        raise AssertionError("README.md was parsed again")
+
+    monkeypatch.setattr(IntegratedDocumentation, "_parse_all_sections", _fail)
+    assert IntegratedDocumentation(readme).sections == first
@@ -0,0 +1,197 @@
+"""
+Pytest unit tests for the ProductionScanner request path.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+# pylint: disable=wrong-import-position
+from aiohttp import web
+
+from core.production_scanner import ProductionScanner, ScanStatus
+
+pytestmark = pytest.mark.asyncio
+
+
+class _TimeoutSession:
+    """Stand-in ClientSession whose requests hang briefly, then time out."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def request(self, *_args, **_kwargs):
+        """Count the request, then fail it like a slow host would."""
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        raise asyncio.TimeoutError
+
+
+async def test_cancelled_scan_stops_issuing_requests():
+    """Cancelling a scan cancels its workers instead of moving to the next platform."""
+    scanner = ProductionScanner(max_concurrent=3)
+    session = _TimeoutSession()
+    scanner.session = session
+
+    task = asyncio.create_task(scanner.scan_username("someone"))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=1.0)
+
+    calls = session.calls
+    await asyncio.sleep(0.3)
+    assert calls <= 3
+    assert session.calls == calls
+
+
+async def test_closing_result_iterator_cancels_workers():
+    """Leaving iter_platform_results early stops the remaining platform scans."""
+    scanner = ProductionScanner(max_concurrent=2)
+    session = _TimeoutSession()
+    scanner.session = session
+
+    platform_ids = ["reddit", "gitlab", "twitch", "linkedin", "telegram", "spotify"]
+    results = scanner.iter_platform_results("someone", platform_ids)
+    await asyncio.wait_for(results.__anext__(), timeout=5.0)
+    await asyncio.wait_for(results.aclose(), timeout=1.0)
+
+    calls = session.calls
+    await asyncio.sleep(0.3)
+    assert session.calls == calls
+
+
+async def _chunked_not_found(request):
+    """Send a long page whose not-found marker only arrives in a later chunk."""
+    response = web.StreamResponse()
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    await response.write(b"<html>" + b"x" * 1000)
+    await asyncio.sleep(0.05)
+    await response.write(b"Page not found" + b"y" * 3000 + b"</html>")
+    await response.write_eof()
+    return response
+
+
+async def _unknown_charset_not_found(_request):
+    """Send a not-found page declaring a charset Python has no codec for."""
+    return web.Response(
+        body=b"<html>Page not found</html>",
+        headers={"Content-Type": "text/html; charset=x-no-such-codec"},
+    )
+
+
+async def _scan_local(monkeypatch, handler):
+    """Run one github request against ``handler`` served on a local port."""
+    for var in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
+        monkeypatch.delenv(var, raising=False)
+    app = web.Application()
+    app.router.add_get("/{username}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+
+    scanner = ProductionScanner()
+    try:
+        return await scanner._make_request(  # pylint: disable=protected-access
+            f"http://127.0.0.1:{port}/someone", scanner.platforms["github"]
+        )
+    finally:
+        await scanner.close()
+        await runner.cleanup()
+
+
+async def test_validator_sees_body_beyond_first_chunk(monkeypatch):
+    """The body prefix is read until max_body_bytes, not just the first chunk."""
+    result = await _scan_local(monkeypatch, _chunked_not_found)
+
+    assert result.status == ScanStatus.NOT_FOUND.value
+    assert not result.found
+
+
+async def test_unknown_charset_decodes_as_utf8(monkeypatch):
+    """An unknown declared charset falls back to utf-8 instead of raising."""
+    result = await _scan_local(monkeypatch, _unknown_charset_not_found)
+
+    assert result.status == ScanStatus.NOT_FOUND.value
+    assert "Page not found" in result.content_preview
+
+
+class _HeadRecorder:
+    """Stand-in ClientSession recording the HEAD requests made through it."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self.heads = []
+
+    def head(self, url, **kwargs):
+        """Record the request; the returned response is never looked at."""
+        self.heads.append((url, kwargs))
+        return _NullResponse()
+
+
+class _NullResponse:
+    """Async context manager standing in for a released response."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+async def test_warm_up_uses_rotated_headers():
+    """Without proxies, every host is warmed with the scanner's own headers."""
+    scanner = ProductionScanner()
+    session = _HeadRecorder()
+    scanner.session = session
+
+    await scanner._warm_connections()  # pylint: disable=protected-access
+    assert len(session.heads) == len(scanner.platforms)
+    assert all(
+        kwargs["headers"]["User-Agent"] in scanner.user_agents
+        for _, kwargs in session.heads
+    )
+
+
+async def test_warm_up_spends_a_rate_limit_token_per_host():
+    """Warm-up HEADs go through each platform's token bucket."""
+    scanner = ProductionScanner()
+    scanner.session = _HeadRecorder()
+
+    await scanner._warm_connections()  # pylint: disable=protected-access
+    assert all(
+        bucket.tokens == bucket.capacity - 1
+        for bucket in scanner.rate_limiters.values()
+    )
+
+
+async def test_warm_up_skipped_with_proxy_pool():
+    """With a proxy pool configured, no direct warm-up requests are sent."""
+    scanner = ProductionScanner(proxy_pool=["http://127.0.0.1:1"])
+    session = _HeadRecorder()
+    scanner.session = session
+
+    await scanner._warm_connections()  # pylint: disable=protected-access
+    assert not session.heads
+
+
+async def test_dns_prefetch_skipped_with_proxy_pool(monkeypatch):
+    """With a proxy pool configured, target hosts are not resolved locally."""
+    scanner = ProductionScanner(proxy_pool=["http://127.0.0.1:1"])
+    lookups = []
+
+    async def _getaddrinfo(host, *_args, **_kwargs):
+        lookups.append(host)
+        return []
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", _getaddrinfo)
+    await scanner._prefetch_dns()  # pylint: disable=protected-access
+    assert not lookups
@@ -319,6 +319,7 @@ class AnimationEngine:
     ANIM_TYPEWRITER = "typewriter"
     ANIM_FADE = "fade"
     ANIM_SLIDE = "slide"
+    FRAME_INTERVAL = 1 / 60  # Seconds between terminal flushes while animating
 
     def __init__(self, enabled: bool = True, animation_type: str = ANIM_TYPEWRITER):
         """Initialize animation engine."""
@@ -331,11 +332,14 @@ class AnimationEngine:
             print(text)
             return
 
+        # Emit one chunk per ~60 Hz frame instead of flushing every character;
+        # total duration stays len(text) * delay.
+        step = max(1, round(self.FRAME_INTERVAL / delay)) if delay > 0 else len(text)
         try:
-            for char in text:
-                sys.stdout.write(char)
+            for start in range(0, len(text), step):
+                sys.stdout.write(text[start : start + step])
                 sys.stdout.flush()
-                time.sleep(delay)
+                time.sleep(delay * step)
             print()
         except KeyboardInterrupt:
             print(text)
@@ -367,6 +371,7 @@ class Banner:
         self.chart = SleekChart(self.terminal, scheme)
         self.animation = AnimationEngine(enabled=True, animation_type="typewriter")
         self.fonts = ProfessionalFonts()
+        self._frames: Dict[str, str] = {}  # Rendered banners, built on first use
 
     def _get_responsive_width(self, ratio: float = 0.9) -> int:
         """Get responsive width based on terminal size."""
@@ -551,14 +556,19 @@ class Banner:
     def display(self, banner_type: str = "main", animate: bool = True) -> None:
         """Display banner with optional animation."""
         banners = {
-            "main": self.get_main_banner(),
-            "scan": self.get_scan_banner(),
-            "analysis": self.get_analysis_banner(),
-            "results": self.get_results_banner(),
-            "dashboard": self.display_system_dashboard(),
+            "main": self.get_main_banner,
+            "scan": self.get_scan_banner,
+            "analysis": self.get_analysis_banner,
+            "results": self.get_results_banner,
+            "dashboard": self.display_system_dashboard,
         }
+        if banner_type not in banners:
+            banner_type = "main"
 
-        output = banners.get(banner_type, banners["main"])
+        # Banners depend only on scheme and terminal size, so render each once
+        output = self._frames.get(banner_type)
+        if output is None:
+            output = self._frames[banner_type] = banners[banner_type]()
 
         if animate:
             self.animation.typewriter_effect(output, delay=0.005)
@@ -575,6 +585,7 @@ class Banner:
         self.scheme = scheme
         self.gradient = GradientRenderer(scheme)
         self.chart = SleekChart(self.terminal, scheme)
+        self._frames.clear()
 
 
 def main():
@@ -13,9 +13,10 @@ This module provides:
 """
 
 import asyncio
+import threading
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
 from rich.console import Console
 from rich.panel import Panel
@@ -148,9 +149,9 @@ class MenuRenderer:
         return panel
 
     def render_data_table(
-        self, headers: List[str], rows: List[List[str]], title: str = ""
+        self, headers: List[str], rows: Iterable[Sequence[str]], title: str = ""
     ) -> Table:
-        """Render data table with responsive columns."""
+        """Render data table with responsive columns; rows may be a generator."""
         table = Table(
             title=title,
             border_style=self.color_scheme,
@@ -234,6 +235,7 @@ class Menu:
         self.renderer = MenuRenderer(self.console, self.color_scheme)
         self.input_handler = MenuInputHandler(self.console, self.color_scheme)
         self._history: List[str] = []
+        self._panel: Optional[Panel] = None  # Built once, reused on every repaint
 
     def add_item(  # pylint: disable=R0913,R0917
         self,
@@ -255,6 +257,7 @@ class Menu:
                 builder.with_action(action)
             item = builder.build()
             self.items[item.key] = item
+            self._panel = None
         except ValueError as exc:
             self.display_error(f"Failed to add menu item: {str(exc)}")
 
@@ -263,6 +266,7 @@ class Menu:
         key_upper = key.upper()
         if key_upper in self.items:
             del self.items[key_upper]
+            self._panel = None
             return True
         return False
 
@@ -272,19 +276,19 @@ class Menu:
 
     def display(self) -> None:
         """Display the menu interface."""
-        menu_content = self.renderer.render_menu_items(self.items)
-        panel = Panel(
-            menu_content,
-            title=self.title,
-            border_style=self.color_scheme,
-            title_align="center",
-            padding=(1, 2),
-        )
-        self.console.print(panel)
-        self.input_handler.set_valid_inputs(self.items.keys())
+        if self._panel is None:
+            self._panel = Panel(
+                self.renderer.render_menu_items(self.items),
+                title=self.title,
+                border_style=self.color_scheme,
+                title_align="center",
+                padding=(1, 2),
+            )
+            self.input_handler.set_valid_inputs(self.items.keys())
+        self.console.print(self._panel)
 
     def display_table(
-        self, headers: List[str], rows: List[List[str]], title: str = ""
+        self, headers: List[str], rows: Iterable[Sequence[str]], title: str = ""
     ) -> None:
         """Display data table."""
         table = self.renderer.render_data_table(headers, rows, title)
@@ -335,6 +339,29 @@ class Menu:
         self._add_to_history(f"Selection: {selection}")
         return selection
 
+    async def prompt_selection_async(self, message: str = "SELECT OPTION") -> str:
+        """Get user menu selection without blocking the event loop.
+
+        The read runs on a daemon thread, so a caller that cancels the await
+        (e.g. on shutdown) is not held up by, or at exit waiting for, stdin.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def _deliver(selection: str) -> None:
+            if not future.done():
+                future.set_result(selection)
+
+        def _read() -> None:
+            selection = self.prompt_selection(message)
+            try:
+                loop.call_soon_threadsafe(_deliver, selection)
+            except RuntimeError:  # Loop already closed
+                pass
+
+        threading.Thread(target=_read, name="menu-prompt", daemon=True).start()
+        return await future
+
     def prompt_input(self, prompt_msg: str, allow_empty: bool = False) -> str:
         """Get user text input."""
         user_input = self.input_handler.prompt_text(prompt_msg, allow_empty)
@@ -355,6 +382,7 @@ class Menu:
         self.color_scheme = scheme.value
         self.renderer = MenuRenderer(self.console, self.color_scheme)
         self.input_handler = MenuInputHandler(self.console, self.color_scheme)
+        self._panel = None
         self._add_to_history(f"Color scheme changed to: {scheme.name}")
 
     def execute_action(self, key: str) -> bool:
@@ -51,7 +51,9 @@ class Terminal:
         """Write styled text to terminal."""
         self.console.print(text, style=style, end="\n" if newline else "")
 
-    def boot_sequence(self, steps: Optional[List[str]] = None) -> None:
+    def boot_sequence(
+        self, steps: Optional[List[str]] = None, animate: bool = True
+    ) -> None:
         """Display boot sequence with status updates."""
         if steps is None:
             steps = [
@@ -61,16 +63,19 @@ class Terminal:
                 "SYSTEM READY. AWAITING COMMANDS...",
             ]
 
-        with self.console.status(
-            "[bold green]Booting system..."
-        ) as status:
-            for step in steps:
-                time.sleep(0.02)
-                status.update(f"[bold green]{step}")
+        if animate:
+            with self.console.status(
+                "[bold green]Booting system..."
+            ) as status:
+                for step in steps:
+                    time.sleep(0.02)
+                    status.update(f"[bold green]{step}")
 
         self.console.print("[bold green]Boot sequence complete.[/bold green]")
 
-    def shutdown_sequence(self, steps: Optional[List[str]] = None) -> None:
+    def shutdown_sequence(
+        self, steps: Optional[List[str]] = None, animate: bool = True
+    ) -> None:
         """Display shutdown sequence with status updates."""
         if steps is None:
             steps = [
@@ -80,12 +85,13 @@ class Terminal:
                 "SYSTEM HALTED.",
             ]
 
-        with self.console.status(
-            "[bold yellow]Shutting down..."
-        ) as status:
-            for step in steps:
-                time.sleep(0.1)
-                status.update(f"[bold yellow]{step}")
+        if animate:
+            with self.console.status(
+                "[bold yellow]Shutting down..."
+            ) as status:
+                for step in steps:
+                    time.sleep(0.1)
+                    status.update(f"[bold yellow]{step}")
 
         self.console.print("[bold yellow]Shutdown complete.[/bold yellow]")
 